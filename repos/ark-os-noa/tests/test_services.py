@@ -1,6 +1,8 @@
 import sys
 from importlib import import_module
 from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
 # Ensure project root is on the path
@@ -21,10 +23,10 @@ SERVICE_MODULES = [
 ]
 
 
-def test_root_endpoints():
-    for module_name in SERVICE_MODULES:
-        module = import_module(module_name)
-        client = TestClient(module.app)
-        response = client.get("/")
-        assert response.status_code == 200
-        assert response.json()["service"] == module_name.split(".")[-2]
+@pytest.mark.parametrize("module_name", SERVICE_MODULES)
+def test_root_endpoints(module_name):
+    module = import_module(module_name)
+    client = TestClient(module.app)
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json()["service"] == module_name.split(".")[-2]
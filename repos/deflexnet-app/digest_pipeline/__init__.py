@@ -5,6 +5,7 @@ from .stages import (
     IntakeStage,
     ClassifierStage,
     GraphExtractStage,
+    FusedInventoryStage,
     EmbeddingsStage,
     EnvSynthesisStage,
     SafetyStage,
@@ -13,6 +14,7 @@ from .stages import (
     IntegratorStage,
     RegistrarStage,
     CRMStranglerStage,
+    write_json,
 )
 
 __all__ = [
@@ -21,6 +23,7 @@ __all__ = [
     "IntakeStage",
     "ClassifierStage",
     "GraphExtractStage",
+    "FusedInventoryStage",
     "EmbeddingsStage",
     "EnvSynthesisStage",
     "SafetyStage",
@@ -29,4 +32,5 @@ __all__ = [
     "IntegratorStage",
     "RegistrarStage",
     "CRMStranglerStage",
+    "write_json",
 ]
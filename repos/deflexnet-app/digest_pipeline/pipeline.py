@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Protocol
+from typing import Dict, FrozenSet, Iterable, List, Optional, Protocol, Set, Tuple
 
 
 @dataclass
@@ -15,15 +18,41 @@ class PipelineContext:
     output_path: Path
     metadata: dict = field(default_factory=dict)
     artifacts: dict = field(default_factory=dict)
-    logs: List[str] = field(default_factory=list)
+    logs: List[Tuple[str, str]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _root_entries: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
 
     def log(self, scope: str, message: str) -> None:
-        entry = f"[{scope}] {message}"
-        self.logs.append(entry)
+        with self._lock:
+            self.logs.append((scope, message))
+
+    def formatted_logs(self) -> List[str]:
+        """Render log entries as ``[scope] message`` strings."""
+
+        return [f"[{scope}] {message}" for scope, message in self.logs]
+
+    def root_entries(self) -> FrozenSet[str]:
+        """Return the names directly under ``repo_path``, listed once per context.
+
+        Stages probing for marker files test membership against this set
+        instead of issuing their own ``exists`` calls on the repository root.
+        """
+
+        with self._lock:
+            if self._root_entries is None:
+                self._root_entries = frozenset(os.listdir(self.repo_path))
+            return self._root_entries
 
 
 class Stage(Protocol):
-    """Protocol describing the callable interface of a stage."""
+    """Protocol describing the callable interface of a stage.
+
+    Stages may declare ``depends_on`` with the names of stages whose output
+    they consume. Stages without the attribute depend on every stage listed
+    before them, which preserves plain sequential ordering. A stage that
+    replaces others may list their names in ``provides`` so dependants
+    resolve to it.
+    """
 
     name: str
 
@@ -32,18 +61,61 @@ class Stage(Protocol):
 
 
 class Pipeline:
-    """Simple sequential pipeline runner."""
+    """Pipeline runner that executes independent stages concurrently.
+
+    Stages are scheduled as soon as all of their dependencies have completed,
+    so the wall-clock time is bounded by the longest dependency chain rather
+    than the sum of every stage.
+    """
 
-    def __init__(self, stages: Iterable[Stage]):
+    def __init__(self, stages: Iterable[Stage], max_workers: Optional[int] = None):
         self._stages = list(stages)
+        self._max_workers = max_workers
+        self._dependencies = self._resolve_dependencies(self._stages)
 
     @property
     def stages(self) -> List[Stage]:
         return list(self._stages)
 
+    @staticmethod
+    def _resolve_dependencies(stages: List[Stage]) -> Dict[str, Set[str]]:
+        dependencies: Dict[str, Set[str]] = {}
+        providers: Dict[str, str] = {}
+        for stage in stages:
+            if stage.name in dependencies:
+                raise ValueError(f"duplicate stage name: {stage.name}")
+            declared: Optional[Tuple[str, ...]] = getattr(stage, "depends_on", None)
+            if declared is None:
+                dependencies[stage.name] = set(dependencies)
+            else:
+                unknown = [name for name in declared if name not in providers]
+                if unknown:
+                    raise ValueError(
+                        f"stage {stage.name} depends on unknown or later stages: {', '.join(unknown)}"
+                    )
+                dependencies[stage.name] = {providers[name] for name in declared}
+            for name in (stage.name, *getattr(stage, "provides", ())):
+                providers[name] = stage.name
+        return dependencies
+
+    def _run_stage(self, stage: Stage, context: PipelineContext) -> None:
+        context.log(stage.name, "starting")
+        stage.run(context)
+        context.log(stage.name, "completed")
+
     def run(self, context: PipelineContext) -> PipelineContext:
-        for stage in self._stages:
-            context.log(stage.name, "starting")
-            stage.run(context)
-            context.log(stage.name, "completed")
+        pending = list(self._stages)
+        completed: Set[str] = set()
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while pending or running:
+                ready = [stage for stage in pending if self._dependencies[stage.name] <= completed]
+                for stage in ready:
+                    pending.remove(stage)
+                    running[executor.submit(self._run_stage, stage, context)] = stage.name
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()
+                    completed.add(name)
         return context
@@ -5,17 +5,150 @@ from __future__ import annotations
 import json
 import os
 import shutil
+from array import array
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List
+from types import MappingProxyType
+from typing import ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Mapping, MutableSequence, Optional, TextIO, Tuple
 
 from .pipeline import PipelineContext
 
+try:  # pragma: no cover - optional accelerator, the stdlib encoder is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+_WRITE_BUFFER = 1 << 20
+
+
+def write_json(payload: object, target: Path) -> None:
+    """Serialise ``payload`` to ``target`` as indented JSON.
+
+    Uses ``orjson`` when it is installed and falls back to the standard
+    library so the pipeline keeps running without third-party packages. The
+    fallback streams encoder chunks into a buffered handle rather than
+    building the whole document as one string first.
+    """
+
+    if orjson is not None:
+        target.write_bytes(orjson.dumps(payload, default=_encode_default, option=orjson.OPT_INDENT_2))
+        return
+    with target.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as handle:
+        json.dump(payload, handle, indent=2, default=_encode_default)
+
+
+def _scandir_recursive(root: Path, skip: FrozenSet[str] = frozenset()) -> Iterator[os.DirEntry]:
+    """Yield file entries beneath ``root`` without following directory symlinks.
+
+    ``os.DirEntry`` caches the type information returned by the directory
+    listing, so walking with ``scandir`` avoids the extra ``stat`` per entry
+    that ``os.walk`` followed by ``Path.stat`` incurs. Directories whose path
+    is in ``skip`` are not descended into.
+    """
+
+    subdirs: List[str] = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path not in skip:
+                    subdirs.append(entry.path)
+            elif not entry.is_dir():
+                yield entry
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir, skip)
+
+
+def _walk_exclusions(context: PipelineContext) -> FrozenSet[str]:
+    """Return the pipeline's output directory as ``_scandir_recursive`` spells it.
+
+    The default output lives inside the analysed repository, so without this a
+    re-run would catalogue (and later read) artifacts it is about to rewrite.
+    """
+
+    try:
+        relative = context.output_path.resolve().relative_to(context.repo_path.resolve())
+    except ValueError:
+        return frozenset()
+    if not relative.parts:
+        return frozenset()
+    return frozenset({os.path.join(os.fspath(context.repo_path), *relative.parts)})
+
+
+_EXTENSION_LANG: Mapping[str, str] = MappingProxyType(
+    {
+        ".py": "python",
+        ".js": "javascript",
+        ".ts": "typescript",
+        ".go": "go",
+        ".rs": "rust",
+        ".java": "java",
+        ".json": "json",
+        ".md": "markdown",
+        ".yml": "yaml",
+        ".yaml": "yaml",
+        ".sh": "shell",
+    }
+)
+
+
+def _extension(file_name: str) -> str:
+    """Return the lower-cased suffix of ``file_name``, ignoring leading dots."""
+
+    dot = file_name.rfind(".")
+    return file_name[dot:].lower() if dot > 0 else ""
+
+
+def _empty_inventory() -> Dict[str, MutableSequence]:
+    """Return a column-oriented file inventory.
+
+    Paths, sizes, and extensions are stored as parallel columns rather than a
+    dict per file, which keeps large inventories compact. Sizes live in an
+    unsigned ``array`` and are converted to a list when serialised.
+    """
+
+    return {"path": [], "bytes": array("Q"), "ext": []}
+
+
+def _root_prefix_length(repo_path: Path) -> int:
+    """Length of the ``repo_path`` prefix on paths yielded by ``_scandir_recursive``."""
+
+    return len(os.path.join(os.fspath(repo_path), ""))
+
+
+def _catalogue_entry(
+    entry: os.DirEntry, prefix_length: int, inventory: Dict[str, MutableSequence]
+) -> Tuple[str, str]:
+    """Append a single file to ``inventory`` and return its path and extension.
+
+    ``entry.path`` always starts with the walk root, so the relative path is
+    a slice of it rather than an ``os.path.relpath`` computation.
+    """
+
+    rel_path = entry.path[prefix_length:]
+    if os.sep != "/":
+        rel_path = rel_path.replace(os.sep, "/")
+    ext = _extension(entry.name)
+    inventory["path"].append(rel_path)
+    inventory["bytes"].append(entry.stat().st_size)
+    inventory["ext"].append(ext)
+    return rel_path, ext
+
+
+def _encode_default(value: object) -> object:
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 @dataclass
 class BaseStage:
     name: str
+    # ``None`` waits on every stage listed earlier in the pipeline; stages that
+    # consume nothing from other stages declare an empty tuple to run at once.
+    depends_on: ClassVar[Optional[Tuple[str, ...]]] = None
+    provides: ClassVar[Tuple[str, ...]] = ()
 
     def run(self, context: PipelineContext) -> None:  # pragma: no cover - interface only
         raise NotImplementedError
@@ -29,53 +162,43 @@ class BaseStage:
 class IntakeStage(BaseStage):
     """Collect repository metadata such as file inventory and provenance."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="intake")
 
     def run(self, context: PipelineContext) -> None:
-        file_inventory: List[Dict[str, str]] = []
-        for root, _, files in os.walk(context.repo_path):
-            for file_name in files:
-                path = Path(root) / file_name
-                rel_path = path.relative_to(context.repo_path).as_posix()
-                size = path.stat().st_size
-                file_inventory.append({"path": rel_path, "bytes": size})
+        file_inventory = _empty_inventory()
+        prefix_length = _root_prefix_length(context.repo_path)
+        for entry in _scandir_recursive(context.repo_path, _walk_exclusions(context)):
+            _catalogue_entry(entry, prefix_length, file_inventory)
         context.metadata["files"] = file_inventory
-        context.log(self.name, f"catalogued {len(file_inventory)} files")
+        context.log(self.name, f"catalogued {len(file_inventory['path'])} files")
 
 
 class ClassifierStage(BaseStage):
     """Identify languages, build systems, and licenses heuristically."""
 
-    EXTENSION_LANG = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".go": "go",
-        ".rs": "rust",
-        ".java": "java",
-        ".json": "json",
-        ".md": "markdown",
-        ".yml": "yaml",
-        ".yaml": "yaml",
-        ".sh": "shell",
-    }
+    depends_on = ("intake",)
+
+    EXTENSION_LANG = _EXTENSION_LANG
 
     def __init__(self) -> None:
         super().__init__(name="classifier")
 
     def run(self, context: PipelineContext) -> None:
         counts: Counter[str] = Counter()
-        for file_info in context.metadata.get("files", []):
-            ext = Path(file_info["path"]).suffix.lower()
-            language = self.EXTENSION_LANG.get(ext, "other")
-            counts[language] += 1
+        extension_lang = _EXTENSION_LANG
+        for ext in context.metadata.get("files", _empty_inventory())["ext"]:
+            counts[extension_lang.get(ext, "other")] += 1
         context.metadata["languages"] = counts
-        context.metadata["build_systems"] = self._detect_build_systems(context.repo_path)
-        context.metadata["license_files"] = self._detect_license_files(context.repo_path)
+        root_entries = context.root_entries()
+        context.metadata["build_systems"] = self._detect_build_systems(root_entries)
+        context.metadata["license_files"] = self._detect_license_files(root_entries)
         context.log(self.name, f"detected languages: {dict(counts)}")
 
-    def _detect_build_systems(self, repo_path: Path) -> List[str]:
+    @staticmethod
+    def _detect_build_systems(root_entries: FrozenSet[str]) -> List[str]:
         candidates = {
             "python": ["pyproject.toml", "requirements.txt"],
             "node": ["package.json"],
@@ -84,17 +207,20 @@ class ClassifierStage(BaseStage):
         }
         found = []
         for system, markers in candidates.items():
-            if any((repo_path / marker).exists() for marker in markers):
+            if any(marker in root_entries for marker in markers):
                 found.append(system)
         return found
 
-    def _detect_license_files(self, repo_path: Path) -> List[str]:
-        return [p.name for p in repo_path.glob("LICENSE*")]
+    @staticmethod
+    def _detect_license_files(root_entries: FrozenSet[str]) -> List[str]:
+        return sorted(name for name in root_entries if name.startswith("LICENSE"))
 
 
 class GraphExtractStage(BaseStage):
     """Create a lightweight dependency and artifact graph."""
 
+    depends_on = ("intake",)
+
     def __init__(self) -> None:
         super().__init__(name="graph_extract")
 
@@ -103,54 +229,149 @@ class GraphExtractStage(BaseStage):
             "nodes": [],
             "edges": [],
         }
-        for file_info in context.metadata.get("files", []):
-            node = {"id": file_info["path"], "type": "file"}
+        for path in context.metadata.get("files", _empty_inventory())["path"]:
+            node = {"id": path, "type": "file"}
             graph["nodes"].append(node)
         context.artifacts["kg.json"] = graph
         target = self._ensure_output_dir(context, "kg.json")
-        target.write_text(json.dumps(graph, indent=2), encoding="utf-8")
+        write_json(graph, target)
         context.log(self.name, f"wrote graph with {len(graph['nodes'])} nodes")
 
 
+class FusedInventoryStage(BaseStage):
+    """Run intake, classification, and graph extraction in a single walk.
+
+    Produces the same metadata and ``kg.json`` artifact as the three separate
+    stages while touching each file entry once. Downstream stages that depend
+    on ``intake``, ``classifier``, or ``graph_extract`` are satisfied by it.
+    """
+
+    depends_on = ()
+    provides = ("intake", "classifier", "graph_extract")
+
+    def __init__(self) -> None:
+        super().__init__(name="inventory")
+
+    def run(self, context: PipelineContext) -> None:
+        file_inventory = _empty_inventory()
+        counts: Counter[str] = Counter()
+        nodes: List[Dict[str, str]] = []
+        extension_lang = _EXTENSION_LANG
+        prefix_length = _root_prefix_length(context.repo_path)
+        for entry in _scandir_recursive(context.repo_path, _walk_exclusions(context)):
+            rel_path, ext = _catalogue_entry(entry, prefix_length, file_inventory)
+            counts[extension_lang.get(ext, "other")] += 1
+            nodes.append({"id": rel_path, "type": "file"})
+
+        context.metadata["files"] = file_inventory
+        context.metadata["languages"] = counts
+        root_entries = context.root_entries()
+        context.metadata["build_systems"] = ClassifierStage._detect_build_systems(root_entries)
+        context.metadata["license_files"] = ClassifierStage._detect_license_files(root_entries)
+        context.log(self.name, f"catalogued {len(file_inventory['path'])} files")
+        context.log(self.name, f"detected languages: {dict(counts)}")
+
+        graph = {"nodes": nodes, "edges": []}
+        context.artifacts["kg.json"] = graph
+        target = self._ensure_output_dir(context, "kg.json")
+        write_json(graph, target)
+        context.log(self.name, f"wrote graph with {len(nodes)} nodes")
+
+
 class EmbeddingsStage(BaseStage):
     """Generate deterministic pseudo-embeddings for code and docs."""
 
+    depends_on = ("intake",)
+
+    # Binary formats whose byte distribution says nothing useful about content.
+    BINARY_EXTENSIONS = frozenset(
+        {
+            ".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf",
+            ".zip", ".tar", ".gz", ".tgz", ".xz", ".7z", ".whl",
+            ".so", ".dll", ".exe",
+        }
+    )
+    # Files above this size are sampled from their head and tail windows.
+    FULL_READ_LIMIT = 1 << 20
+    SAMPLE_WINDOW = 64 * 1024
+
     def __init__(self) -> None:
         super().__init__(name="embeddings")
 
     def run(self, context: PipelineContext) -> None:
-        embeddings: Dict[str, List[float]] = {}
-        for file_info in context.metadata.get("files", []):
-            path = file_info["path"]
-            full_path = context.repo_path / path
-            text = full_path.read_text(encoding="utf-8", errors="ignore")
-            vector = self._hash_to_vector(text)
-            embeddings[path] = vector
-        context.artifacts["embeddings.json"] = embeddings
+        # Vectors are streamed straight to disk so the full mapping is never
+        # held in memory; the artifact entry records where it was written.
+        # Reads are spread over a thread pool so several files are in flight
+        # at once; ``map`` yields results in inventory order.
         target = self._ensure_output_dir(context, "embeddings.json")
-        target.write_text(json.dumps(embeddings, indent=2), encoding="utf-8")
-        context.log(self.name, f"generated embeddings for {len(embeddings)} files")
-
-    def _hash_to_vector(self, text: str, dimensions: int = 8) -> List[float]:
-        vector = [0.0] * dimensions
-        for index, char in enumerate(text.encode("utf-8")):
-            vector[index % dimensions] += (char - 128) / 128.0
+        inventory = context.metadata.get("files", _empty_inventory())
+        candidates = [
+            (path, size)
+            for path, size, ext in zip(inventory["path"], inventory["bytes"], inventory["ext"])
+            if ext not in self.BINARY_EXTENSIONS
+        ]
+        skipped = len(inventory["path"]) - len(candidates)
+        repo_path = context.repo_path
+
+        def embed(candidate: Tuple[str, int]) -> array:
+            path, size = candidate
+            return self._hash_to_vector(self._read_sample(repo_path / path, size))
+
+        count = 0
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor, target.open(
+            "w", encoding="utf-8", buffering=_WRITE_BUFFER
+        ) as handle:
+            handle.write("{")
+            for (path, _), vector in zip(candidates, executor.map(embed, candidates)):
+                handle.write(",\n  " if count else "\n  ")
+                json.dump(path, handle)
+                handle.write(": ")
+                json.dump(vector.tolist(), handle)
+                count += 1
+            handle.write("\n}" if count else "}")
+        context.artifacts["embeddings.json"] = target
+        context.log(self.name, f"generated embeddings for {count} files ({skipped} binary files skipped)")
+
+    def _read_sample(self, path: Path, size: int) -> bytes:
+        if size <= self.FULL_READ_LIMIT:
+            return path.read_bytes()
+        window = self.SAMPLE_WINDOW
+        with path.open("rb") as handle:
+            # The inventory size may be stale, so size the tail from the open
+            # handle; a file that shrank below the limit is read whole.
+            actual = os.fstat(handle.fileno()).st_size
+            if actual <= self.FULL_READ_LIMIT:
+                return handle.read()
+            head = handle.read(window)
+            handle.seek(max(0, actual - window))
+            return head + handle.read(window)
+
+    def _hash_to_vector(self, data: bytes, dimensions: int = 8) -> array:
+        # Strided slices and ``sum`` over bytes both run in C, so each lane is
+        # reduced without a per-byte interpreter loop.
+        vector = array("d")
+        for lane in range(dimensions):
+            column = data[lane::dimensions]
+            vector.append((sum(column) - 128 * len(column)) / 128.0)
         length = sum(abs(v) for v in vector) or 1.0
-        return [round(v / length, 4) for v in vector]
+        return array("d", (round(v / length, 4) for v in vector))
 
 
 class EnvSynthesisStage(BaseStage):
     """Collect runtime environment hints and configuration templates."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="env_synthesis")
 
     def run(self, context: PipelineContext) -> None:
         env_hints = defaultdict(list)
+        root_entries = context.root_entries()
         for candidate in ("Dockerfile", "docker-compose.yml", "Makefile", ".env", ".env.example"):
-            path = context.repo_path / candidate
-            if path.exists():
-                env_hints[path.suffix or path.name].append(candidate)
+            if candidate in root_entries:
+                env_hints[os.path.splitext(candidate)[1] or candidate].append(candidate)
         context.metadata["environment"] = dict(env_hints)
         context.log(self.name, f"found env hints: {dict(env_hints)}")
 
@@ -158,6 +379,8 @@ class EnvSynthesisStage(BaseStage):
 class SafetyStage(BaseStage):
     """Record security scanning placeholders."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="safety")
 
@@ -169,21 +392,24 @@ class SafetyStage(BaseStage):
         }
         context.artifacts["safety.json"] = report
         target = self._ensure_output_dir(context, "safety.json")
-        target.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        write_json(report, target)
         context.log(self.name, "stub safety report created")
 
 
 class RunnerStage(BaseStage):
     """Simulate builds and test execution."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="runner")
 
     def run(self, context: PipelineContext) -> None:
         tasks: List[str] = []
-        if (context.repo_path / "pyproject.toml").exists():
+        root_entries = context.root_entries()
+        if "pyproject.toml" in root_entries:
             tasks.append("poetry build")
-        if (context.repo_path / "package.json").exists():
+        if "package.json" in root_entries:
             tasks.append("npm test")
         context.metadata["runbook"] = tasks or ["manual review"]
         context.log(self.name, f"planned tasks: {context.metadata['runbook']}")
@@ -192,6 +418,8 @@ class RunnerStage(BaseStage):
 class ReverseEngineerStage(BaseStage):
     """Store reverse-engineering placeholder tasks."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="reverse_engineer")
 
@@ -203,13 +431,15 @@ class ReverseEngineerStage(BaseStage):
         }
         context.artifacts["reverse.json"] = reverse_report
         target = self._ensure_output_dir(context, "reverse.json")
-        target.write_text(json.dumps(reverse_report, indent=2), encoding="utf-8")
+        write_json(reverse_report, target)
         context.log(self.name, "reverse engineering plan stubbed")
 
 
 class IntegratorStage(BaseStage):
     """Generate integration stubs for adapters and telemetry."""
 
+    depends_on = ()
+
     def __init__(self) -> None:
         super().__init__(name="integrator")
 
@@ -220,7 +450,7 @@ class IntegratorStage(BaseStage):
         }
         context.artifacts["integrations.json"] = adapters
         target = self._ensure_output_dir(context, "integrations.json")
-        target.write_text(json.dumps(adapters, indent=2), encoding="utf-8")
+        write_json(adapters, target)
         context.log(self.name, "integration stubs generated")
 
 
@@ -237,10 +467,45 @@ class RegistrarStage(BaseStage):
             "metadata": context.metadata,
             "artifacts": sorted(context.artifacts.keys()),
         }
-        (output_dir / "profile.json").write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        self._write_profile(profile, output_dir / "profile.json")
         (output_dir / "system_card.md").write_text(self._system_card(profile), encoding="utf-8")
         context.log(self.name, "profile and system card written")
 
+    def _write_profile(self, profile: Dict[str, object], target: Path) -> None:
+        """Write ``profile.json`` incrementally, one metadata key per line.
+
+        The file inventory is emitted element by element so the largest part
+        of the profile is never encoded as a single string.
+        """
+
+        with target.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as handle:
+            handle.write('{\n  "metadata": {')
+            for index, (key, value) in enumerate(profile["metadata"].items()):
+                handle.write(",\n    " if index else "\n    ")
+                json.dump(key, handle)
+                handle.write(": ")
+                if key == "files":
+                    self._write_columns(handle, value)
+                else:
+                    json.dump(value, handle, default=_encode_default)
+            handle.write('\n  },\n  "artifacts": ')
+            json.dump(profile["artifacts"], handle)
+            handle.write("\n}\n")
+
+    @staticmethod
+    def _write_columns(handle: TextIO, columns: Dict[str, Iterable]) -> None:
+        handle.write("{")
+        for index, (name, column) in enumerate(columns.items()):
+            handle.write(", " if index else "")
+            json.dump(name, handle)
+            handle.write(": [")
+            for position, item in enumerate(column):
+                if position:
+                    handle.write(", ")
+                json.dump(item, handle)
+            handle.write("]")
+        handle.write("}")
+
     def _system_card(self, profile: Dict[str, object]) -> str:
         languages = profile["metadata"].get("languages", {})
         lines = ["# DeflexNet Digest", "", "## Languages"]
@@ -255,6 +520,8 @@ class RegistrarStage(BaseStage):
 class CRMStranglerStage(BaseStage):
     """Plan CRM proxy rollout with feature flags."""
 
+    depends_on = ("registrar",)
+
     def __init__(self) -> None:
         super().__init__(name="crm_strangler")
 
@@ -270,5 +537,5 @@ class CRMStranglerStage(BaseStage):
         }
         context.artifacts["crm_plan.json"] = plan
         target = self._ensure_output_dir(context, "crm_plan.json")
-        target.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+        write_json(plan, target)
         context.log(self.name, "CRM strangler plan generated")
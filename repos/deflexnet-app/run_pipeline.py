@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 from pathlib import Path
 
 from digest_pipeline import (
     CRMStranglerStage,
-    ClassifierStage,
     EmbeddingsStage,
     EnvSynthesisStage,
-    GraphExtractStage,
-    IntakeStage,
+    FusedInventoryStage,
     IntegratorStage,
     Pipeline,
     PipelineContext,
@@ -20,14 +18,19 @@ from digest_pipeline import (
     ReverseEngineerStage,
     RunnerStage,
     SafetyStage,
+    write_json,
 )
 
 
+@functools.lru_cache(maxsize=1)
 def build_pipeline() -> Pipeline:
+    """Return the default pipeline.
+
+    Stages keep no per-run state and ``Pipeline.run`` only touches the
+    context it is given, so a single instance is shared across runs.
+    """
     stages = [
-        IntakeStage(),
-        ClassifierStage(),
-        GraphExtractStage(),
+        FusedInventoryStage(),
         EmbeddingsStage(),
         EnvSynthesisStage(),
         SafetyStage(),
@@ -58,7 +61,7 @@ def main() -> None:
     result = pipeline.run(context)
 
     summary_path = output_path / "summary.json"
-    summary_path.write_text(json.dumps({"logs": result.logs}, indent=2), encoding="utf-8")
+    write_json({"logs": result.formatted_logs()}, summary_path)
     print(f"Digest pipeline completed. Logs written to {summary_path}")
 
 
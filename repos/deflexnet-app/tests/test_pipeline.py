@@ -5,7 +5,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from digest_pipeline import PipelineContext
+from digest_pipeline import EmbeddingsStage, IntakeStage, Pipeline, PipelineContext, RegistrarStage, SafetyStage
 from run_pipeline import build_pipeline
 
 
@@ -20,5 +20,66 @@ def test_pipeline_runs(tmp_path: Path) -> None:
     result = pipeline.run(context)
 
     assert (output / "profile.json").exists()
-    assert result.metadata["files"], "intake should collect files"
-    assert any("registrar" in log for log in result.logs)
+    assert result.metadata["files"]["path"], "intake should collect files"
+    assert any(scope == "registrar" for scope, _ in result.logs)
+
+
+def test_pipeline_respects_stage_dependencies(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("print('hi')\n", encoding="utf-8")
+
+    context = PipelineContext(repo_path=repo, output_path=tmp_path / "output")
+    result = build_pipeline().run(context)
+
+    position = {log: index for index, log in enumerate(result.logs)}
+    stages = build_pipeline().stages
+    providers = {alias: stage.name for stage in stages for alias in (stage.name, *stage.provides)}
+    for index, stage in enumerate(stages):
+        if stage.depends_on is None:
+            dependencies = [earlier.name for earlier in stages[:index]]
+        else:
+            dependencies = [providers[dependency] for dependency in stage.depends_on]
+        for provider in dependencies:
+            assert position[(provider, "completed")] < position[(stage.name, "starting")]
+
+
+def test_partial_pipeline_runs_registrar_last(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("print('hi')\n", encoding="utf-8")
+
+    output = tmp_path / "output"
+    pipeline = Pipeline([IntakeStage(), SafetyStage(), RegistrarStage()])
+    result = pipeline.run(PipelineContext(repo_path=repo, output_path=output))
+
+    assert (output / "profile.json").exists()
+    position = {log: index for index, log in enumerate(result.logs)}
+    for earlier in ("intake", "safety"):
+        assert position[(earlier, "completed")] < position[("registrar", "starting")]
+
+
+def test_rerun_skips_output_inside_repo(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("print('hi')\n", encoding="utf-8")
+    output = repo / "build" / "digest"
+
+    build_pipeline().run(PipelineContext(repo_path=repo, output_path=output))
+    result = build_pipeline().run(PipelineContext(repo_path=repo, output_path=output))
+
+    assert list(result.metadata["files"]["path"]) == ["main.py"]
+
+
+def test_embedding_sample_tolerates_shrunk_file(tmp_path: Path) -> None:
+    stage = EmbeddingsStage()
+    sample = tmp_path / "large.txt"
+    sample.write_bytes(b"x" * (stage.FULL_READ_LIMIT + stage.SAMPLE_WINDOW))
+    stale_size = sample.stat().st_size
+    sample.write_bytes(b"y" * (stage.FULL_READ_LIMIT + 1))
+
+    data = stage._read_sample(sample, stale_size + 1)
+    assert data == b"y" * (2 * stage.SAMPLE_WINDOW)
+
+    sample.write_bytes(b"z" * 10)
+    assert stage._read_sample(sample, stale_size) == b"z" * 10
@@ -8,7 +8,8 @@ external packages so it can run inside pre-commit hooks and CI jobs.
 from __future__ import annotations
 
 import json
-import re
+import os
+import string
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,7 +18,7 @@ from typing import Dict, List, Tuple
 REGISTRY_RELATIVE_PATH = Path(".workspace/registry")
 SCHEMA_FILENAME = "registry.schema.json"
 REQUIRED_FIELDS = {"id", "name", "version", "files", "dependencies", "owners"}
-SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[0-9A-Za-z.-]+)?$")
+_PRERELEASE_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
 
 
 @dataclass
@@ -30,6 +31,45 @@ class ValidationError(Exception):
     pass
 
 
+def _is_semver(version: object) -> bool:
+    """Return True for ``MAJOR.MINOR.PATCH`` with an optional ``-prerelease`` tag."""
+
+    if not isinstance(version, str):
+        return False
+    core, dash, prerelease = version.partition("-")
+    if dash and not (prerelease and _PRERELEASE_CHARS.issuperset(prerelease)):
+        return False
+    parts = core.split(".")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
+class _PathIndex:
+    """Answer existence checks from cached directory listings.
+
+    Components commonly reference several files in the same directory, so
+    listing each parent once replaces one ``stat`` per referenced file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._listings: Dict[Path, frozenset] = {}
+
+    def exists(self, relative: str) -> bool:
+        candidate = self._root / relative
+        name = candidate.name
+        if name in ("", ".", ".."):
+            return candidate.exists()
+        parent = candidate.parent
+        listing = self._listings.get(parent)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(parent))
+            except OSError:
+                listing = frozenset()
+            self._listings[parent] = listing
+        return name in listing
+
+
 def load_documents(root: Path) -> List[RegistryDocument]:
     registry_dir = root / REGISTRY_RELATIVE_PATH
     if not registry_dir.exists():
@@ -54,55 +94,59 @@ def load_documents(root: Path) -> List[RegistryDocument]:
 def validate_documents(documents: List[RegistryDocument], repo_root: Path) -> Tuple[int, int]:
     owners: Dict[str, Tuple[Path, dict]] = {}
     components: Dict[str, Tuple[Path, dict]] = {}
+    path_index = _PathIndex(repo_root)
+    path_exists = path_index.exists
+    required_fields = REQUIRED_FIELDS
 
+    # Single pass over every document. Owner and dependency references may
+    # point at entries defined in later documents, so they are resolved once
+    # all owners and components are known.
     for doc in documents:
+        doc_path = doc.path
         for owner in doc.data.get("owners", []):
             owner_id = owner.get("id")
             if not owner_id:
-                raise ValidationError(f"{doc.path}: owner entry missing 'id'")
+                raise ValidationError(f"{doc_path}: owner entry missing 'id'")
             previous = owners.get(owner_id)
             if previous and previous[1] != owner:
                 raise ValidationError(
-                    f"{doc.path}: conflicting owner definition for '{owner_id}' (first defined in {previous[0]})"
+                    f"{doc_path}: conflicting owner definition for '{owner_id}' (first defined in {previous[0]})"
                 )
-            owners[owner_id] = (doc.path, owner)
+            owners[owner_id] = (doc_path, owner)
 
-    for doc in documents:
         for component in doc.data.get("components", []):
-            missing = REQUIRED_FIELDS - component.keys()
+            missing = required_fields - component.keys()
             if missing:
                 raise ValidationError(
-                    f"{doc.path}: component '{component.get('id', '<unknown>')}' missing fields: {sorted(missing)}"
+                    f"{doc_path}: component '{component.get('id', '<unknown>')}' missing fields: {sorted(missing)}"
                 )
 
             component_id = component["id"]
             previous = components.get(component_id)
             if previous:
                 raise ValidationError(
-                    f"{doc.path}: duplicate component id '{component_id}' also defined in {previous[0]}"
+                    f"{doc_path}: duplicate component id '{component_id}' also defined in {previous[0]}"
                 )
 
-            if not SEMVER_RE.match(component["version"]):
+            if not _is_semver(component["version"]):
                 raise ValidationError(
-                    f"{doc.path}: component '{component_id}' has non-semver version '{component['version']}'"
+                    f"{doc_path}: component '{component_id}' has non-semver version '{component['version']}'"
                 )
 
-            for owner_id in component["owners"]:
-                if owner_id not in owners:
-                    raise ValidationError(
-                        f"{doc.path}: component '{component_id}' references unknown owner '{owner_id}'"
-                    )
-
             for file_path in component["files"]:
-                candidate = repo_root / file_path
-                if not candidate.exists():
+                if not path_exists(file_path):
                     raise ValidationError(
-                        f"{doc.path}: component '{component_id}' references missing file '{file_path}'"
+                        f"{doc_path}: component '{component_id}' references missing file '{file_path}'"
                     )
 
-            components[component_id] = (doc.path, component)
+            components[component_id] = (doc_path, component)
 
     for component_id, (doc_path, component) in components.items():
+        for owner_id in component["owners"]:
+            if owner_id not in owners:
+                raise ValidationError(
+                    f"{doc_path}: component '{component_id}' references unknown owner '{owner_id}'"
+                )
         for dependency in component.get("dependencies", []):
             if not dependency:
                 raise ValidationError(
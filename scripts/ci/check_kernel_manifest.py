@@ -2,16 +2,48 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 from core.kernel.manifest import KernelManifest, load_manifest
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback for air-gapped builds
+    orjson = None
+
+
+# Only directories that never hold service descriptors are pruned; build and
+# target trees are still walked, as ``rglob`` did.
+_PRUNED_DIRS = frozenset({".git", "node_modules", ".venv", "__pycache__"})
+
+
+def _iter_service_json(root: Path) -> Iterator[Path]:
+    """Yield ``service.json`` files beneath ``root``, skipping VCS and dependency trees.
+
+    Unreadable directories are skipped rather than aborting the walk.
+    """
+
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _PRUNED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name == "service.json":
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
 
 def _load_service_descriptors(root: Path) -> Dict[str, Dict[str, object]]:
     descriptors: Dict[str, Dict[str, object]] = {}
-    for path in root.rglob("service.json"):
-        data = json.loads(path.read_text())
+    for path in _iter_service_json(root):
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         service_id = data.get("id")
         if not service_id:
             continue
@@ -18,21 +18,26 @@ issue links next to the in-document anchors::
 
 Environment requirements
 ------------------------
-* GitHub CLI (``gh``) must be installed and authenticated
-  (``gh auth status`` should report "Logged in").
-* The ``GH_TOKEN``/``GITHUB_TOKEN`` environment variables are optional but
-  recommended for CI usage.
+* A GitHub token with ``repo`` scope, supplied through ``GH_TOKEN`` or
+  ``GITHUB_TOKEN``. When neither is set, the token of an authenticated
+  GitHub CLI (``gh auth token``) is used instead.
+* Issues are looked up and created through the GitHub REST API over a single
+  keep-alive HTTPS connection; ``gh`` is only invoked to read its token.
 """
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
@@ -41,6 +46,26 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 DOC_PATH = REPO_ROOT / "docs/plans/gap_remediation_tasks.md"
 MARKER_START = "<!-- BEGIN: GAP_REMEDIATION_TASKS -->"
 MARKER_END = "<!-- END: GAP_REMEDIATION_TASKS -->"
+ISSUE_CODE_PREFIX = "AGENTOS-"
+ISSUE_TITLE_SEPARATOR = " — "
+# Matches from the anchor through the subsequent metadata block. The lookahead
+# stops before the next anchor, the roadmap summary, or the end marker.
+TASK_RE = re.compile(
+    r"<a id=\"(?P<anchor>[^\"]+)\"></a>\n"  # anchor line
+    r"### (?P<code>AGENTOS-\d+) — (?P<title>.+?)\n"  # heading
+    r"(?P<body>.*?)(?=\n<a id=\"|\nRoadmap alignment:|<!-- END: GAP_REMEDIATION_TASKS -->)",
+    re.DOTALL,
+)
+ANCHOR_LINE_RE = re.compile(
+    r"^- (?P<prefix>.+? — \[View task\]\(#(?P<anchor>[^)]+)\))$",
+    re.MULTILINE,
+)
+GITHUB_API_HOST = "api.github.com"
+SEARCH_PAGE_SIZE = 100
+SEARCH_MAX_PAGES = 5
+# Upper bound on concurrent issue creations; GitHub's secondary rate limits
+# penalise larger bursts of content-creating requests.
+ISSUE_CREATE_WORKERS = 8
 
 
 @dataclass
@@ -53,7 +78,7 @@ class TaskDefinition:
 
     @property
     def issue_title(self) -> str:
-        return f"{self.code} — {self.title}"
+        return f"{self.code}{ISSUE_TITLE_SEPARATOR}{self.title}"
 
     def issue_body(self) -> str:
         header = (
@@ -75,25 +100,19 @@ def load_document() -> str:
 
 
 def extract_task_block(document: str) -> str:
-    if MARKER_START not in document or MARKER_END not in document:
+    start = document.find(MARKER_START)
+    end = document.find(MARKER_END, start + len(MARKER_START)) if start != -1 else -1
+    if end == -1:
         raise TaskParserError(
             "Roadmap markers not found. Ensure the document contains the generated block."
         )
-    return document.split(MARKER_START, 1)[1].split(MARKER_END, 1)[0]
+    return document[start + len(MARKER_START):end]
 
 
 def parse_tasks(document: str) -> List[TaskDefinition]:
     block = extract_task_block(document)
-    # Matches from the anchor through the subsequent metadata block. The lookahead
-    # stops before the next anchor, the roadmap summary, or the end marker.
-    pattern = re.compile(
-        r"<a id=\"(?P<anchor>[^\"]+)\"></a>\n"  # anchor line
-        r"### (?P<code>AGENTOS-\d+) — (?P<title>.+?)\n"  # heading
-        r"(?P<body>.*?)(?=\n<a id=\"|\nRoadmap alignment:|<!-- END: GAP_REMEDIATION_TASKS -->)",
-        re.DOTALL,
-    )
     tasks: List[TaskDefinition] = []
-    for match in pattern.finditer(block):
+    for match in TASK_RE.finditer(block):
         body = match.group("body").strip()
         anchor = match.group("anchor")
         # Ensure body retains markdown structure and trailing newline for checklists.
@@ -110,79 +129,221 @@ def parse_tasks(document: str) -> List[TaskDefinition]:
     return tasks
 
 
-def ensure_gh_available() -> None:
-    if shutil.which("gh") is None:
-        raise RuntimeError(
-            "GitHub CLI (gh) is required but was not found in PATH. Run scripts/install_gh_cli.sh first."
-        )
-
-
 def run_gh_command(args: List[str], check: bool = True) -> subprocess.CompletedProcess[str]:
     result = subprocess.run(args, check=check, capture_output=True, text=True)
     return result
 
 
-def lookup_existing_issue(repo: str, title: str, code: str) -> Optional[Dict[str, str]]:
-    search_expr = f'"{code}" in:title'
-    try:
-        result = run_gh_command(
-            [
-                "gh",
-                "issue",
-                "list",
-                "--repo",
-                repo,
-                "--state",
-                "all",
-                "--search",
-                search_expr,
-                "--json",
-                "number,title,url,state",
-            ]
-        )
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - CLI error path
-        raise RuntimeError(exc.stderr.strip() or exc.stdout.strip()) from exc
+def resolve_github_token(hostname: str = "github.com") -> str:
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    return _gh_auth_token(hostname)
+
 
+@functools.lru_cache(maxsize=4)
+def _gh_auth_token(hostname: str) -> str:
+    """Ask the GitHub CLI for its token once per hostname and process."""
+    if shutil.which("gh") is None:
+        raise RuntimeError(
+            "Set GH_TOKEN or GITHUB_TOKEN, or install and authenticate the GitHub CLI "
+            "(scripts/install_gh_cli.sh) so its token can be used."
+        )
     try:
-        payload = json.loads(result.stdout or "[]")
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive branch
-        raise RuntimeError(f"Failed to decode gh response: {exc}\n{result.stdout}") from exc
+        result = run_gh_command(["gh", "auth", "token", "--hostname", hostname])
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(
+            "GitHub CLI is not authenticated. Run 'gh auth login' first."
+        ) from exc
+    token = result.stdout.strip()
+    if not token:
+        raise RuntimeError("GitHub CLI returned an empty token. Run 'gh auth login' first.")
+    return token
+
+
+class GitHubClient:
+    """Minimal GitHub REST client that reuses one keep-alive HTTPS connection."""
+
+    def __init__(self, token: str, host: str = GITHUB_API_HOST) -> None:
+        self._connection = http.client.HTTPSConnection(host, timeout=30)
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "noa-ark-os-create-agentos-tasks",
+        }
+        self.rate_limit_remaining: Optional[int] = None
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, str]] = None) -> object:
+        headers = dict(self._headers)
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        try:
+            self._connection.request(method, path, body=body, headers=headers)
+            response = self._connection.getresponse()
+            raw = response.read()
+        except (http.client.HTTPException, OSError) as exc:
+            # Drop the connection so the next request reconnects cleanly.
+            self._connection.close()
+            raise RuntimeError(f"GitHub API request {method} {path} failed: {exc}") from exc
+
+        remaining = response.getheader("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self.rate_limit_remaining = int(remaining)
+        text = raw.decode("utf-8", errors="replace")
+        if response.status >= 400:
+            raise RuntimeError(f"GitHub API request {method} {path} returned {response.status}: {text}")
+        try:
+            return json.loads(text or "null")
+        except json.JSONDecodeError as exc:  # pragma: no cover - defensive branch
+            raise RuntimeError(f"Failed to decode GitHub response: {exc}\n{text}") from exc
+
+
+def _issue_summary(issue: Dict[str, object]) -> Dict[str, str]:
+    return {
+        "number": issue.get("number"),
+        "title": issue.get("title", ""),
+        "url": issue.get("html_url"),
+        "state": issue.get("state"),
+    }
+
+
+def issue_code(title: str) -> Optional[str]:
+    """Return the ``AGENTOS-<n>`` code that prefixes an issue title, if any."""
+
+    code, separator, _ = title.strip().partition(ISSUE_TITLE_SEPARATOR)
+    if not separator or not code.startswith(ISSUE_CODE_PREFIX):
+        return None
+    if not code[len(ISSUE_CODE_PREFIX):].isdigit():
+        return None
+    return code
+
+
+def prefetch_existing_issues(client: GitHubClient, repo: str) -> Dict[str, Dict[str, str]]:
+    """Return existing AGENTOS issues keyed by task code using the search API."""
+
+    query = urllib.parse.quote(f"repo:{repo} is:issue AGENTOS- in:title")
+    issues: Dict[str, Dict[str, str]] = {}
+    for page in range(1, SEARCH_MAX_PAGES + 1):
+        payload = client.request(
+            "GET", f"/search/issues?q={query}&per_page={SEARCH_PAGE_SIZE}&page={page}"
+        )
+        items = payload.get("items", []) if isinstance(payload, dict) else []
+        for issue in items:
+            code = issue_code(str(issue.get("title", "")))
+            if code:
+                issues.setdefault(code, _issue_summary(issue))
+        if len(items) < SEARCH_PAGE_SIZE:
+            break
+    return issues
+
+
+def create_issue(client: GitHubClient, repo: str, task: TaskDefinition) -> Dict[str, str]:
+    payload = client.request(
+        "POST",
+        f"/repos/{repo}/issues",
+        {"title": task.issue_title, "body": task.issue_body()},
+    )
+    if not isinstance(payload, dict):  # pragma: no cover - defensive branch
+        raise RuntimeError(f"Unexpected GitHub response when creating {task.code}: {payload!r}")
+    return _issue_summary(payload)
+
+
+def create_issues(
+    token: str,
+    repo: str,
+    tasks: List[TaskDefinition],
+    created: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Dict[str, Dict[str, str]]:
+    """Create issues for ``tasks`` concurrently and return them keyed by task code.
+
+    ``http.client`` connections are not thread-safe, so each worker thread
+    opens and reuses its own ``GitHubClient``. Each issue is recorded in
+    ``created`` as soon as it exists, so when a creation fails the caller's
+    mapping still holds every issue made before the first error is re-raised.
+    """
+
+    created = {} if created is None else created
+    if not tasks:
+        return created
 
-    for issue in payload:
-        issue_title = issue.get("title", "")
-        if issue_title.strip().startswith(f"{code} —"):
-            return issue
-    return None
+    local = threading.local()
+    clients: List[GitHubClient] = []
+    clients_lock = threading.Lock()
 
+    def create(task: TaskDefinition) -> Dict[str, str]:
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = GitHubClient(token)
+            with clients_lock:
+                clients.append(client)
+        return create_issue(client, repo, task)
 
-def create_issue(repo: str, task: TaskDefinition) -> Dict[str, str]:
-    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as tmp:
-        tmp.write(task.issue_body())
-        tmp_path = tmp.name
+    first_error: Optional[BaseException] = None
     try:
-        result = run_gh_command(
-            [
-                "gh",
-                "issue",
-                "create",
-                "--repo",
-                repo,
-                "--title",
-                task.issue_title,
-                "--body-file",
-                tmp_path,
-                "--json",
-                "number,url,title,state",
-            ]
-        )
+        with ThreadPoolExecutor(max_workers=min(ISSUE_CREATE_WORKERS, len(tasks))) as executor:
+            futures = {executor.submit(create, task): task for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    created[futures[future].code] = future.result()
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
     finally:
-        os.unlink(tmp_path)
+        for client in clients:
+            client.close()
+    if first_error is not None:
+        raise first_error
+    return created
+
+
+def record_issue_links(
+    document: str,
+    tasks: List[TaskDefinition],
+    existing_by_code: Dict[str, Dict[str, str]],
+    created_by_code: Dict[str, Dict[str, str]],
+    update_doc: bool,
+) -> bool:
+    """Report issues in document order and optionally link them in the doc.
+
+    Returns whether anything changed. Tasks without an existing or created
+    issue are left unlinked.
+    """
 
-    try:
-        payload = json.loads(result.stdout)
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"Failed to decode gh response: {exc}\n{result.stdout}") from exc
-    return payload
+    updated = False
+    for task in tasks:
+        existing = existing_by_code.get(task.code)
+        if existing:
+            task.issue_url = existing.get("url")
+            print(f"✔ Reusing existing issue for {task.code}: {task.issue_url}")
+            continue
+        created = created_by_code.get(task.code)
+        if not created:
+            continue
+        task.issue_url = created.get("url")
+        print(f"✨ Created issue for {task.code}: {task.issue_url}")
+        updated = True
+
+    if update_doc and any(task.issue_url for task in tasks):
+        new_document = update_document_links(document, tasks)
+        if new_document != document:
+            DOC_PATH.write_text(new_document, encoding="utf-8")
+            updated = True
+            print(f"📝 Updated {DOC_PATH.relative_to(REPO_ROOT)} with GitHub issue links")
+        else:
+            print("ℹ️ Document already contains GitHub issue links")
+    return updated
 
 
 def update_document_links(document: str, tasks: Iterable[TaskDefinition]) -> str:
@@ -190,22 +351,25 @@ def update_document_links(document: str, tasks: Iterable[TaskDefinition]) -> str
     if not tasks_by_anchor:
         return document
 
-    def replacement(match: re.Match[str]) -> str:
+    # Copy the document through in slices, appending the issue link to each
+    # matching anchor line, and join once at the end.
+    parts: List[str] = []
+    position = 0
+    for match in ANCHOR_LINE_RE.finditer(document):
+        task = tasks_by_anchor.get(match.group("anchor"))
+        if not task:
+            continue
         line = match.group(0)
-        anchor = match.group("anchor")
-        task = tasks_by_anchor.get(anchor)
-        if not task or not task.issue_url:
-            return line
         if "GitHub issue" in line:
-            return line
-        return f"{line} · [GitHub issue]({task.issue_url})"
-
-    pattern = re.compile(
-        r"^- (?P<prefix>.+? — \[View task\]\(#(?P<anchor>[^)]+)\))$",
-        re.MULTILINE,
-    )
-    updated_document = pattern.sub(replacement, document)
-    return updated_document
+            continue
+        end = match.end()
+        parts.append(document[position:end])
+        parts.append(f" · [GitHub issue]({task.issue_url})")
+        position = end
+    if not parts:
+        return document
+    parts.append(document[position:])
+    return "".join(parts)
 
 
 def print_plan(tasks: Iterable[TaskDefinition]) -> None:
@@ -233,7 +397,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument(
         "--execute",
         action="store_true",
-        help="Create issues on GitHub (requires gh to be installed and authenticated)",
+        help="Create issues on GitHub (requires GH_TOKEN/GITHUB_TOKEN or an authenticated gh CLI)",
     )
     parser.add_argument(
         "--update-doc",
@@ -255,36 +419,26 @@ def main(argv: Optional[List[str]] = None) -> int:
         print_plan(tasks)
         return 0
 
-    ensure_gh_available()
+    token = resolve_github_token()
 
-    # Verify authentication before performing any writes.
+    with GitHubClient(token) as client:
+        existing_by_code = prefetch_existing_issues(client, args.repo)
+    missing = [task for task in tasks if task.code not in existing_by_code]
+    created_by_code: Dict[str, Dict[str, str]] = {}
     try:
-        run_gh_command(["gh", "auth", "status", "--hostname", "github.com"])
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(
-            "GitHub CLI is not authenticated. Run 'gh auth login' first."
-        ) from exc
-
-    updated = False
-    for task in tasks:
-        existing = lookup_existing_issue(args.repo, task.issue_title, task.code)
-        if existing:
-            task.issue_url = existing.get("url")
-            print(f"✔ Reusing existing issue for {task.code}: {task.issue_url}")
-            continue
-        created = create_issue(args.repo, task)
-        task.issue_url = created.get("url")
-        print(f"✨ Created issue for {task.code}: {task.issue_url}")
-        updated = True
+        create_issues(token, args.repo, missing, created_by_code)
+    except Exception:
+        # Record the issues that were created before the failure so they are
+        # reported and linked rather than lost; a rerun reuses them.
+        print(
+            f"✘ Issue creation failed after {len(created_by_code)} of {len(missing)} issues",
+            file=sys.stderr,
+        )
+        record_issue_links(document, tasks, existing_by_code, created_by_code, args.update_doc)
+        raise
 
-    if args.update_doc and any(task.issue_url for task in tasks):
-        new_document = update_document_links(document, tasks)
-        if new_document != document:
-            DOC_PATH.write_text(new_document, encoding="utf-8")
-            updated = True
-            print(f"📝 Updated {DOC_PATH.relative_to(REPO_ROOT)} with GitHub issue links")
-        else:
-            print("ℹ️ Document already contains GitHub issue links")
+    # Report in document order once every creation has completed.
+    updated = record_issue_links(document, tasks, existing_by_code, created_by_code, args.update_doc)
 
     if not updated:
         print("No changes made (issues already existed and document was up-to-date).")
@@ -5,10 +5,13 @@ Automatically generates Rust agent implementations from the 928-agent registry.
 """
 
 import csv
+import functools
+import multiprocessing
 import os
 import re
+import string
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 # Existing agents (already implemented)
 EXISTING_AGENTS = {
@@ -42,6 +45,18 @@ EXISTING_AGENTS = {
     "model-selector-agent",
 }
 
+# Registry layer classification: first matching substring wins, in priority order
+_LAYER_RULES = (
+    ("board", "L2Reasoning"),
+    ("l2", "L2Reasoning"),
+    ("executive", "L1Autonomy"),
+    ("l1", "L1Autonomy"),
+    ("stack", "L3Orchestration"),
+    ("l3", "L3Orchestration"),
+    ("micro", "L5Infrastructure"),
+    ("l5", "L5Infrastructure"),
+)
+
 # Layer mapping
 LAYER_MAP = {
     "L1Autonomy": "autonomy",
@@ -51,34 +66,42 @@ LAYER_MAP = {
     "L5Infrastructure": "infrastructure",
 }
 
+class _SanitizeTable(dict):
+    """str.translate table keeping [a-z0-9_] and mapping every other code point to '_'"""
+    def __missing__(self, codepoint: int) -> int:
+        return 0x5F
+
+_IDENT_CHARS = frozenset(string.ascii_lowercase + string.digits + '_')
+_SANITIZE_TABLE = _SanitizeTable(
+    (c, c if chr(c) in _IDENT_CHARS else 0x5F) for c in range(128)
+)
+_MULTI_UND = re.compile(r'_+')
+
+@functools.lru_cache(maxsize=None)
 def sanitize_name(name: str) -> str:
     """Convert agent name to valid Rust identifier"""
-    name = name.lower()
-    name = re.sub(r'[^a-z0-9_]', '_', name)
-    name = re.sub(r'_+', '_', name)
+    name = name.lower().translate(_SANITIZE_TABLE)
+    name = _MULTI_UND.sub('_', name)
     name = name.strip('_')
     return name
 
+@functools.lru_cache(maxsize=None)
 def to_camel_case(name: str) -> str:
     """Convert snake_case to CamelCase"""
     parts = name.split('_')
     return ''.join(p.capitalize() for p in parts if p)
 
-def generate_agent_struct(agent: Dict) -> str:
-    """Generate Rust agent struct code"""
-    struct_name = to_camel_case(sanitize_name(agent['name']))
-    agent_id = sanitize_name(agent['name'])
-    
-    return f'''//! {agent['name']} - Auto-generated
+# Rust source for a generated agent module, filled in with str.format_map
+_AGENT_RS_TEMPLATE = '''//! {name} - Auto-generated
 //! 
-//! {agent.get('purpose', 'Agent implementation')}
+//! {doc_purpose}
 
 use crate::unified_types::*;
 use crate::Result;
 use tokio::sync::RwLock;
 use uuid::Uuid;
 
-/// {agent['name']}
+/// {name}
 pub struct {struct_name} {{
     metadata: AgentMetadata,
     state: RwLock<AgentState>,
@@ -89,14 +112,14 @@ impl {struct_name} {{
         let metadata = AgentMetadata {{
             id: Uuid::new_v4(),
             agent_id: "{agent_id}".to_string(),
-            name: "{agent['name']}".to_string(),
-            layer: AgentLayer::{agent['layer']},
+            name: "{name}".to_string(),
+            layer: AgentLayer::{layer},
             category: AgentCategory::Other,
             agent_type: AgentType::Worker,
             language: AgentLanguage::Rust,
-            description: "{agent.get('purpose', 'Auto-generated agent')}".to_string(),
-            role: "{agent.get('role', 'Agent')}".to_string(),
-            purpose: "{agent.get('purpose', 'Agent functionality')}".to_string(),
+            description: "{description}".to_string(),
+            role: "{role}".to_string(),
+            purpose: "{purpose}".to_string(),
             state: AgentState::Created,
             health_status: HealthStatus::Unknown,
             parent_id: None,
@@ -153,7 +176,7 @@ mod tests {{
     #[tokio::test]
     async fn test_agent_creation() {{
         let agent = {struct_name}::new();
-        assert_eq!(agent.metadata().name, "{agent['name']}");
+        assert_eq!(agent.metadata().name, "{name}");
     }}
     
     #[tokio::test]
@@ -165,6 +188,25 @@ mod tests {{
 }}
 '''
 
+def generate_agent_struct(agent: Dict) -> str:
+    """Generate Rust agent struct code"""
+    agent_id = sanitize_name(agent['name'])
+    return _AGENT_RS_TEMPLATE.format_map({
+        'name': agent['name'],
+        'struct_name': to_camel_case(agent_id),
+        'agent_id': agent_id,
+        'layer': agent['layer'],
+        'doc_purpose': agent.get('purpose', 'Agent implementation'),
+        'description': agent.get('purpose', 'Auto-generated agent'),
+        'role': agent.get('role', 'Agent'),
+        'purpose': agent.get('purpose', 'Agent functionality'),
+    })
+
+def _write_agent_file(job: Tuple[Dict, str]) -> None:
+    """Render and write a single agent module (runs in a worker process)"""
+    agent, file_path = job
+    Path(file_path).write_bytes(generate_agent_struct(agent).encode('utf-8'))
+
 def load_registry(csv_path: str) -> List[Dict]:
     """Load agents from CSV registry"""
     agents = []
@@ -176,17 +218,8 @@ def load_registry(csv_path: str) -> List[Dict]:
                 continue
             
             # Determine layer
-            layer_str = row.get('layer', 'L4Operations')
-            if 'board' in layer_str.lower() or 'l2' in layer_str.lower():
-                layer = 'L2Reasoning'
-            elif 'executive' in layer_str.lower() or 'l1' in layer_str.lower():
-                layer = 'L1Autonomy'
-            elif 'stack' in layer_str.lower() or 'l3' in layer_str.lower():
-                layer = 'L3Orchestration'
-            elif 'micro' in layer_str.lower() or 'l5' in layer_str.lower():
-                layer = 'L5Infrastructure'
-            else:
-                layer = 'L4Operations'
+            layer_str = row.get('layer', 'L4Operations').lower()
+            layer = next((l for sub, l in _LAYER_RULES if sub in layer_str), 'L4Operations')
             
             agents.append({
                 'name': agent_name,
@@ -222,37 +255,40 @@ def generate_agents(registry_path: str, output_dir: str, batch_size: int = 50):
     for layer, agent_list in by_layer.items():
         print(f"   {layer}: {len(agent_list)} agents")
     
-    # Process in batches
+    # Process in batches, rendering and writing files across worker processes
     total_generated = 0
     
-    for layer, agent_list in by_layer.items():
-        layer_dir = LAYER_MAP.get(layer, layer.lower())
-        layer_path = Path(output_dir) / layer_dir
-        layer_path.mkdir(parents=True, exist_ok=True)
-        
-        print(f"\n🔧 Generating {layer} agents...")
-        
-        # Process in batches
-        for i in range(0, len(agent_list), batch_size):
-            batch = agent_list[i:i+batch_size]
-            batch_num = (i // batch_size) + 1
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for layer, agent_list in by_layer.items():
+            layer_dir = LAYER_MAP.get(layer, layer.lower())
+            layer_path = Path(output_dir) / layer_dir
+            layer_path.mkdir(parents=True, exist_ok=True)
             
-            print(f"   Batch {batch_num}: {len(batch)} agents", end='')
+            print(f"\n🔧 Generating {layer} agents...")
             
-            for agent in batch:
-                file_name = f"{sanitize_name(agent['name'])}.rs"
-                file_path = layer_path / file_name
+            # Agents whose names sanitize to the same module share a file; the
+            # last registry entry wins, so keep only that one to avoid racing
+            # writers on the same path.
+            jobs_by_path = {}
+            for agent in agent_list:
+                file_path = str(layer_path / f"{sanitize_name(agent['name'])}.rs")
+                jobs_by_path.pop(file_path, None)
+                jobs_by_path[file_path] = agent
+            jobs = [(agent, file_path) for file_path, agent in jobs_by_path.items()]
+            
+            # Process in batches
+            for i in range(0, len(jobs), batch_size):
+                batch = jobs[i:i+batch_size]
+                batch_num = (i // batch_size) + 1
                 
-                # Generate code
-                code = generate_agent_struct(agent)
+                print(f"   Batch {batch_num}: {len(batch)} agents", end='')
                 
-                # Write file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(code)
+                for _ in pool.imap_unordered(_write_agent_file, batch, chunksize=32):
+                    pass
                 
-                total_generated += 1
+                print(f" ✓")
             
-            print(f" ✓")
+            total_generated += len(agent_list)
     
     # Generate mod.rs files
     print(f"\n📝 Generating module files...")
@@ -260,21 +296,19 @@ def generate_agents(registry_path: str, output_dir: str, batch_size: int = 50):
         layer_dir = LAYER_MAP.get(layer, layer.lower())
         layer_path = Path(output_dir) / layer_dir
         
-        mod_content = f"//! {layer} Agents - Auto-generated\n\n"
-        
-        for agent in agent_list:
-            module_name = sanitize_name(agent['name'])
-            struct_name = to_camel_case(module_name)
-            mod_content += f"pub mod {module_name};\n"
+        module_names = [sanitize_name(agent['name']) for agent in agent_list]
+        struct_names = [to_camel_case(module_name) for module_name in module_names]
         
-        mod_content += "\n// Re-exports\n"
-        for agent in agent_list:
-            module_name = sanitize_name(agent['name'])
-            struct_name = to_camel_case(module_name)
-            mod_content += f"pub use {module_name}::{struct_name};\n"
+        parts = [f"//! {layer} Agents - Auto-generated", ""]
+        parts.extend(f"pub mod {module_name};" for module_name in module_names)
+        parts.append("")
+        parts.append("// Re-exports")
+        parts.extend(
+            f"pub use {module_name}::{struct_name};"
+            for module_name, struct_name in zip(module_names, struct_names)
+        )
         
-        with open(layer_path / "mod.rs", 'w', encoding='utf-8') as f:
-            f.write(mod_content)
+        (layer_path / "mod.rs").write_bytes(("\n".join(parts) + "\n").encode('utf-8'))
     
     print(f"\n✅ Generation complete!")
     print(f"   Total agents generated: {total_generated}")
@@ -4,9 +4,17 @@
 from __future__ import annotations
 
 import json
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 ROOT = Path(__file__).resolve().parents[1]
 LOG_DIR = ROOT / ".workspace" / "indexes"
@@ -17,21 +25,25 @@ LOG_FILES = {
     "relocation": LOG_DIR / "relocation.log",
     "documentation": LOG_DIR / "documentation.log",
 }
+DETAIL_ROWS = 10
 
 
-def load_entries(path: Path) -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
+def iter_entries(path: Path) -> Iterator[Dict[str, Any]]:
     if not path.exists():
-        return entries
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return entries
+        return
+    with path.open("rb") as handle:
+        for raw in handle:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                yield _json_loads(raw)
+            except ValueError:
+                continue
+
+
+def load_entries(path: Path) -> List[Dict[str, Any]]:
+    return list(iter_entries(path))
 
 
 def format_timestamp(value: Any) -> str:
@@ -52,13 +64,34 @@ def format_timestamp(value: Any) -> str:
     return str(value)
 
 
-def summarise(entries: List[Dict[str, Any]], ledger: str) -> Dict[str, Any]:
-    meaningful = [e for e in entries if not e.get("event", {}).get("event_type", "").endswith("genesis")]
-    latest = meaningful[-1] if meaningful else None
+def _is_genesis(entry: Dict[str, Any]) -> bool:
+    return entry.get("event", {}).get("event_type", "").endswith("genesis")
+
+
+def _record_timestamp(policy: Dict[str, Any]) -> Any:
+    return policy.get("record", {}).get("timestamp")
+
+
+def summarise(entries: Iterable[Dict[str, Any]], ledger: str) -> Dict[str, Any]:
+    """Summarise a ledger in one pass, keeping only the trailing detail rows.
+
+    ``recent`` holds the operational entries among the last ``DETAIL_ROWS``
+    records, so callers do not need to repeat the genesis check.
+    """
+    total = 0
+    latest = None
+    recent: deque = deque(maxlen=DETAIL_ROWS)
+    for entry in entries:
+        genesis = _is_genesis(entry)
+        recent.append(None if genesis else entry)
+        if not genesis:
+            total += 1
+            latest = entry
     return {
-        "total": len(meaningful),
+        "total": total,
         "latest": latest,
         "ledger": ledger,
+        "recent": [entry for entry in recent if entry is not None],
     }
 
 
@@ -68,7 +101,7 @@ def render_entry(entry: Dict[str, Any]) -> str:
     actor = event.get("actor", "unknown")
     target = event.get("target") or event.get("scope", "n/a")
     signature = policy.get("signature", "")
-    timestamp = policy.get("record", {}).get("timestamp") or event.get("timestamp")
+    timestamp = _record_timestamp(policy) or event.get("timestamp")
     return f"| {format_timestamp(timestamp)} | {actor} | {target} | `{signature[:16]}` |"
 
 
@@ -90,7 +123,7 @@ def build_handbook() -> str:
         "It reflects the state as of {}.\n".format(now)
     )
 
-    ledger_summaries = {name: summarise(load_entries(path), name) for name, path in LOG_FILES.items()}
+    ledger_summaries = {name: summarise(iter_entries(path), name) for name, path in LOG_FILES.items()}
 
     sections.append("## Ledger Overview\n")
     sections.append("| Ledger | Entries | Last Event | Scope |")
@@ -98,25 +131,17 @@ def build_handbook() -> str:
     for name, summary in ledger_summaries.items():
         latest = summary["latest"]
         event_scope = latest.get("event", {}).get("scope", "—") if latest else "—"
-        timestamp = format_timestamp(
-            latest.get("policy", {}).get("record", {}).get("timestamp")
-            if latest
-            else None
-        )
+        timestamp = format_timestamp(_record_timestamp(latest.get("policy", {})) if latest else None)
         sections.append(f"| {name.title()} | {summary['total']} | {timestamp} | {event_scope} |")
 
     for name, summary in ledger_summaries.items():
         sections.append(f"\n## {name.title()} Ledger Detail\n")
-        all_entries = load_entries(LOG_FILES[name])
-        if not any(e for e in all_entries if not e.get("event", {}).get("event_type", "").endswith("genesis")):
+        if not summary["total"]:
             sections.append("No operational entries recorded yet.\n")
             continue
         sections.append("| Timestamp | Actor | Target | Signature |")
         sections.append("| --- | --- | --- | --- |")
-        for entry in all_entries[-10:]:
-            if entry.get("event", {}).get("event_type", "").endswith("genesis"):
-                continue
-            sections.append(render_entry(entry))
+        sections.extend(render_entry(entry) for entry in summary["recent"])
         sections.append("")
 
     sections.append("## SOP Alignment\n")
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import io
 import json
+import os
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
 from core.kernel.manifest import KernelManifest, KernelService, load_manifest
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback for air-gapped builds
+    orjson = None
+
+try:  # pragma: no cover - optional zstd support
+    import zstandard
+except ImportError:  # pragma: no cover - gzip-only builds
+    zstandard = None
+
+# Archives hold a single small manifest; level 9 costs noticeably more time
+# than the default gzip level for no meaningful size gain.
+TARFILE_COMPRESS_LEVEL = 6
+ZSTD_COMPRESS_LEVEL = 3
+COMPRESSION_CHOICES = ("gzip", "zstd")
+# none: leave flushing to the OS; per-file: fsync each service's artifacts as
+# soon as that service is built; batch: fsync everything once at the end.
+FSYNC_CHOICES = ("none", "batch", "per-file")
+
 
 @dataclass
 class PackagingResult:
@@ -23,13 +45,81 @@ def _ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _canonical_json(payload: object) -> bytes:
+    """Serialise ``payload`` in the packager's canonical form.
+
+    Archived manifests and fingerprint digests are always produced by the
+    stdlib encoder with sorted keys, so they stay byte-identical to earlier
+    builds whether or not orjson is installed, and any JSON value (including
+    fractional resource limits) is accepted.
+    """
+    return json.dumps(payload, sort_keys=True).encode("utf-8")
+
+
 def _write_json(path: Path, payload: object) -> None:
-    path.write_text(json.dumps(payload, sort_keys=True, indent=2) + "\n")
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) + b"\n"
+    else:
+        data = (json.dumps(payload, sort_keys=True, indent=2) + "\n").encode("utf-8")
+    # Leave unchanged files alone so rebuilds keep their mtimes and downstream
+    # build tools do not treat them as new.
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+# Bounded because long-lived importers (single_host, env tooling) would
+# otherwise keep every bundle ever hashed alive.
+@functools.lru_cache(maxsize=256)
+def _sha256_hex(blob: bytes) -> str:
+    # Hash the whole buffer in one call so OpenSSL can use its SHA-NI code
+    # path; never feed payloads through many small update() calls.
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _sha256_backend() -> str:
+    """Report whether hashlib's SHA-256 is OpenSSL-backed or the builtin."""
+    return "openssl" if hashlib.sha256.__name__.startswith("openssl_") else "builtin"
+
+
+def _fsync_paths(paths: List[Path], root: Path) -> None:
+    """Flush ``paths`` and then their directories (POSIX) to stable storage.
+
+    Every directory from each file up to ``root``'s parent is flushed too, so
+    directories this build created keep their entries after a crash.
+    """
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    if os.name != "posix":
+        return
+    stop = root.parent
+    directories = {}
+    for path in paths:
+        directory = path.parent
+        while directory not in directories:
+            directories[directory] = None
+            if directory == stop or directory == directory.parent:
+                break
+            directory = directory.parent
+    for directory in directories:
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
 
 def _hash_payload(payload: object) -> str:
-    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
-    return digest
+    # Services frequently share interface/dependency bundles, so digests are
+    # memoised on the canonical bytes rather than recomputed per service.
+    return _sha256_hex(_canonical_json(payload))
 
 
 def _emit_container_layout(service: KernelService, destination: Path) -> Path:
@@ -44,7 +134,19 @@ def _emit_container_layout(service: KernelService, destination: Path) -> Path:
     return destination / "config.json"
 
 
-def _emit_tarball(service: KernelService, destination: Path) -> Path:
+def _tarball_name(file_name: str, compression: str) -> str:
+    """Map the manifest's ``.tar.gz`` artifact name onto ``compression``."""
+    if compression == "gzip":
+        return file_name
+    for suffix in (".tar.gz", ".tgz"):
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)] + ".tar.zst"
+    return file_name + ".zst"
+
+
+def _emit_tarball(service: KernelService, destination: Path, compression: str = "gzip") -> Path:
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd compression requested but the 'zstandard' package is not installed")
     _ensure_directory(destination.parent)
     archive_layout = {
         "service": service.id,
@@ -52,11 +154,16 @@ def _emit_tarball(service: KernelService, destination: Path) -> Path:
         "boot": service.boot,
         "resources": service.resources,
     }
-    payload_path = destination.parent / "payload.json"
-    _write_json(payload_path, archive_layout)
-    with tarfile.open(destination, "w:gz", compresslevel=9, format=tarfile.GNU_FORMAT) as tar:
+    data = _canonical_json(archive_layout)
+    buffer = io.BytesIO()
+    options = {"compresslevel": TARFILE_COMPRESS_LEVEL} if compression == "gzip" else {}
+    with tarfile.open(
+        fileobj=buffer,
+        mode="w:gz" if compression == "gzip" else "w",
+        format=tarfile.GNU_FORMAT,
+        **options,
+    ) as tar:
         info = tarfile.TarInfo(name="manifest.json")
-        data = json.dumps(archive_layout, sort_keys=True).encode("utf-8")
         info.size = len(data)
         info.uid = 0
         info.gid = 0
@@ -65,7 +172,10 @@ def _emit_tarball(service: KernelService, destination: Path) -> Path:
         info.mode = 0o644
         info.mtime = 0
         tar.addfile(info, io.BytesIO(data))
-    payload_path.unlink()
+    archive = buffer.getvalue()
+    if compression == "zstd":
+        archive = zstandard.ZstdCompressor(level=ZSTD_COMPRESS_LEVEL).compress(archive)
+    destination.write_bytes(archive)
     return destination
 
 
@@ -82,49 +192,66 @@ def _emit_oci_layout(service: KernelService, destination: Path) -> Path:
     return destination / "index.json"
 
 
+def _build_one(
+    service: KernelService,
+    output_dir: Path,
+    compression: str = "gzip",
+    fsync: str = "none",
+) -> PackagingResult:
+    service_dir = output_dir / service.id / service.version
+    _ensure_directory(service_dir)
+
+    container_path = service_dir / "container"
+    container_config = _emit_container_layout(service, container_path)
+
+    tarball_path = service_dir / _tarball_name(service.artifacts.tarball["file"], compression)
+    tarball_file = _emit_tarball(service, tarball_path, compression)
+
+    oci_path = service_dir / "oci"
+    oci_index = _emit_oci_layout(service, oci_path)
+
+    manifest_fingerprint = {
+        "service": service.id,
+        "version": service.version,
+        "hash": _hash_payload(
+            {
+                "interfaces": service.interfaces,
+                "dependencies": service.dependencies,
+                "optional": service.optionalDependencies,
+            }
+        ),
+    }
+    _write_json(service_dir / "fingerprint.json", manifest_fingerprint)
+
+    artifacts = [container_config, tarball_file, oci_index, service_dir / "fingerprint.json"]
+    if fsync == "per-file":
+        _fsync_paths(artifacts, output_dir)
+    return PackagingResult(
+        service_id=service.id,
+        version=service.version,
+        artifacts=artifacts,
+    )
+
+
 def build_artifacts(
     output_dir: Path,
     manifest: Optional[KernelManifest] = None,
     manifest_path: Optional[Path] = None,
+    compression: str = "gzip",
+    fsync: str = "none",
 ) -> List[PackagingResult]:
     if manifest is None:
         manifest = load_manifest(manifest_path)
 
-    results: List[PackagingResult] = []
-    for service in manifest.services.values():
-        service_dir = output_dir / service.id / service.version
-        _ensure_directory(service_dir)
-
-        container_path = service_dir / "container"
-        container_config = _emit_container_layout(service, container_path)
-
-        tarball_path = service_dir / service.artifacts.tarball["file"]
-        tarball_file = _emit_tarball(service, tarball_path)
-
-        oci_path = service_dir / "oci"
-        oci_index = _emit_oci_layout(service, oci_path)
-
-        manifest_fingerprint = {
-            "service": service.id,
-            "version": service.version,
-            "hash": _hash_payload(
-                {
-                    "interfaces": service.interfaces,
-                    "dependencies": service.dependencies,
-                    "optional": service.optionalDependencies,
-                }
-            ),
-        }
-        _write_json(service_dir / "fingerprint.json", manifest_fingerprint)
-
-        results.append(
-            PackagingResult(
-                service_id=service.id,
-                version=service.version,
-                artifacts=[container_config, tarball_file, oci_index, service_dir / "fingerprint.json"],
-            )
+    # Every service writes into its own directory, so the builds are
+    # independent and can overlap their serialisation, gzip and file IO.
+    services = list(manifest.services.values())
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(
+            executor.map(lambda service: _build_one(service, output_dir, compression, fsync), services)
         )
-
+    if fsync == "batch":
+        _fsync_paths([artifact for result in results for artifact in result.artifacts], output_dir)
     return results
 
 
@@ -133,26 +260,31 @@ def _assert_exists(path: Path) -> None:
         raise FileNotFoundError(f"Missing artifact: {path}")
 
 
-def validate_artifacts(output_dir: Path, manifest: Optional[KernelManifest] = None) -> None:
+def validate_artifacts(
+    output_dir: Path,
+    manifest: Optional[KernelManifest] = None,
+    compression: str = "gzip",
+) -> None:
     manifest = manifest or load_manifest()
     for service in manifest.services.values():
         service_dir = output_dir / service.id / service.version
         _assert_exists(service_dir / "container" / "config.json")
-        _assert_exists(service_dir / service.artifacts.tarball["file"])
+        _assert_exists(service_dir / _tarball_name(service.artifacts.tarball["file"], compression))
         _assert_exists(service_dir / "oci" / "index.json")
         _assert_exists(service_dir / "fingerprint.json")
 
 
 def _build_command(args: argparse.Namespace) -> None:
     output = Path(args.output).resolve()
-    results = build_artifacts(output)
+    print(f"sha256 backend: {_sha256_backend()}")
+    results = build_artifacts(output, compression=args.compression, fsync=args.fsync)
     for result in results:
         print(f"built {result.service_id}@{result.version} -> {len(result.artifacts)} artifacts")
 
 
 def _validate_command(args: argparse.Namespace) -> None:
     output = Path(args.output).resolve()
-    validate_artifacts(output)
+    validate_artifacts(output, compression=args.compression)
     print(f"validated artifacts under {output}")
 
 
@@ -162,10 +294,28 @@ def create_parser() -> argparse.ArgumentParser:
 
     build_parser = subparsers.add_parser("build", help="Build packaging artifacts")
     build_parser.add_argument("--output", default="build/artifacts", help="Destination directory for artifacts")
+    build_parser.add_argument(
+        "--compression",
+        choices=COMPRESSION_CHOICES,
+        default="gzip",
+        help="Tarball compression; zstd requires the 'zstandard' package",
+    )
+    build_parser.add_argument(
+        "--fsync",
+        choices=FSYNC_CHOICES,
+        default="none",
+        help="Durability mode for written artifacts (default: leave flushing to the OS)",
+    )
     build_parser.set_defaults(func=_build_command)
 
     validate_parser = subparsers.add_parser("validate", help="Validate previously built artifacts")
     validate_parser.add_argument("--output", default="build/artifacts", help="Directory containing artifacts")
+    validate_parser.add_argument(
+        "--compression",
+        choices=COMPRESSION_CHOICES,
+        default="gzip",
+        help="Tarball compression used when the artifacts were built",
+    )
     validate_parser.set_defaults(func=_validate_command)
 
     return parser
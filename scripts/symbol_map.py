@@ -4,13 +4,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
 
 
 def collect_symbols(root: Path) -> dict[str, list[str]]:
+    # Walk with os.scandir so only matching ``.rs`` files become Path objects;
+    # directory entries reuse the type cached by the scan. Subdirectories are
+    # pushed in reverse to keep rglob's pre-order output.
     symbols: dict[str, list[str]] = {}
-    for path in root.rglob("*.rs"):
-        symbols[str(path)] = ["fn_placeholder", "struct_placeholder"]
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".rs"):
+                        symbols[str(Path(entry.path))] = ["fn_placeholder", "struct_placeholder"]
+        except OSError:
+            # Like rglob, skip directories that cannot be listed.
+            continue
+        stack.extend(reversed(subdirs))
     return symbols
 
 
@@ -23,8 +23,10 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import os
+import re
 import shutil
 import signal
 import subprocess
@@ -35,8 +37,74 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, AsyncIterator
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback for air-gapped hosts
+    orjson = None
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:  # pragma: no cover - optional Linux inotify bindings
+    from asyncinotify import Inotify, Mask
+except ImportError:  # pragma: no cover - fall back to directory polling
+    Inotify = None
+    Mask = None
+
+try:  # pragma: no cover - optional multi-pattern DFA scanner
+    import hyperscan
+except ImportError:  # pragma: no cover - compiled ``re`` fallback
+    hyperscan = None
+
 INCIDENT_ROOT = Path("tools/offline_pr_queue/triage")
 SUPPORTED_EXTENSIONS = {".json", ".ndjson"}
+# Linux ``_IOW(0x94, 9, int)``: share extents with the source on CoW
+# filesystems such as btrfs and XFS.
+FICLONE = 0x40049409
+# Upper bound per copy_file_range call; copying loops until EOF regardless.
+COPY_CHUNK = 1 << 30
+# Inotify mode never lists the directory, so the set of seen event files is
+# pruned against a fresh listing once it grows past this size.
+SEEN_PRUNE_THRESHOLD = 50_000
+
+# Categories in priority order; within a category the first listed keyword
+# present in the log is reported as the signal.
+FAILURE_PATTERNS: Dict[str, tuple[str, ...]] = {
+    "lint": ("eslint", "flake8", "cargo fmt", "lint"),
+    "type": ("mypy", "pyright", "tsc", "typeerror", "typing"),
+    "test": ("pytest", "unittest", "assert", "test failed"),
+    "flaky_test": ("flake", "flaky", "rerun", "retry"),
+    "infrastructure": ("docker", "network", "timeout", "connection"),
+}
+_KEYWORD_LABELS = {key: label for label, keys in FAILURE_PATTERNS.items() for key in keys}
+_KEYWORDS = tuple(_KEYWORD_LABELS)
+# A zero-width lookahead reports a keyword at every offset, so overlapping
+# keywords from different categories (``rerunittest``) are all observed in
+# a single pass over the log.
+_KEYWORD_RE = re.compile(
+    b"(?=(" + b"|".join(re.escape(key.encode("ascii")) for key in _KEYWORDS) + b"))",
+    re.IGNORECASE,
+)
+_DECISIVE_KEY = next(iter(FAILURE_PATTERNS.values()))[0]
+# Logs are scanned in fixed-size chunks; consecutive chunks overlap by just
+# enough bytes for a keyword straddling the boundary to be seen whole.
+LOG_READ_CHUNK = 1 << 20
+_KEYWORD_OVERLAP = max(len(key) for key in _KEYWORDS) - 1
+
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_database() -> Any:
+    """Compile every keyword into one Hyperscan database on first use."""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[key.encode("ascii") for key in _KEYWORDS],
+        ids=list(range(len(_KEYWORDS))),
+        elements=len(_KEYWORDS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_KEYWORDS),
+    )
+    return database
 
 
 @dataclass(slots=True)
@@ -91,43 +159,36 @@ class FailureClassifier:
     """Classify failures using heuristics on logs and payload metadata."""
 
     def classify(self, event: TriageEvent) -> ClassificationResult:
+        hinted = event.hinted_category
+        if hinted in FAILURE_PATTERNS:
+            # CI already told us the category; trust it and skip the log scan.
+            return ClassificationResult(category=hinted, confidence=0.9, signals=[f"hint:{hinted}"])
+
         signals: list[str] = []
-        text = ""
+        found: set[str] = set()
         if event.log_path and event.log_path.exists():
             try:
-                text = event.log_path.read_text(encoding="utf-8", errors="ignore")
+                found = self._scan_log(event.log_path)
             except OSError as exc:  # pragma: no cover - exercised via tests
                 signals.append(f"failed_to_read_log:{exc}")
         elif isinstance(event.payload.get("message"), str):
-            text = event.payload["message"]
+            self._scan(event.payload["message"].encode("utf-8", errors="ignore"), found)
 
-        text_lower = text.lower()
-        hinted = event.hinted_category
         if hinted:
             signals.append(f"hint:{hinted}")
 
         category = "unknown"
         confidence = 0.45
 
-        patterns = {
-            "lint": ["eslint", "flake8", "cargo fmt", "lint"],
-            "type": ["mypy", "pyright", "tsc", "typeerror", "typing"],
-            "test": ["pytest", "unittest", "assert", "test failed"],
-            "flaky_test": ["flake", "flaky", "rerun", "retry"],
-            "infrastructure": ["docker", "network", "timeout", "connection"],
-        }
-
-        for label, keys in patterns.items():
-            for key in keys:
-                if key in text_lower:
-                    category = label
-                    signals.append(f"match:{label}:{key}")
-                    confidence = max(confidence, 0.75 if hinted == label else 0.65)
-                    break
-            if category == label:
+        for label, keys in FAILURE_PATTERNS.items():
+            key = next((key for key in keys if key in found), None)
+            if key is not None:
+                category = label
+                signals.append(f"match:{label}:{key}")
+                confidence = max(confidence, 0.75 if hinted == label else 0.65)
                 break
 
-        if category == "test" and "timeout" in text_lower:
+        if category == "test" and "timeout" in found:
             category = "flaky_test"
             signals.append("promote:test->flaky")
             confidence = max(confidence, 0.7)
@@ -138,6 +199,63 @@ class FailureClassifier:
 
         return ClassificationResult(category=category, confidence=confidence, signals=signals)
 
+    @classmethod
+    def _scan_log(cls, path: Path) -> set[str]:
+        """Scan a log chunk by chunk, stopping once the outcome is decided."""
+        found: set[str] = set()
+        tail = b""
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(LOG_READ_CHUNK), b""):
+                window = tail + chunk
+                cls._scan(window, found)
+                if _DECISIVE_KEY in found:
+                    break
+                tail = window[-_KEYWORD_OVERLAP:]
+        return found
+
+    @staticmethod
+    def _scan(data: bytes, found: set[str]) -> None:
+        """Add every known keyword present in ``data`` to ``found``.
+
+        Hyperscan is used when installed; otherwise the compiled alternation
+        is run with ``re``.
+        """
+        if hyperscan is not None:
+
+            def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+                found.add(_KEYWORDS[pattern_id])
+
+            _hyperscan_database().scan(data, match_event_handler=on_match)
+            return
+        for match in _KEYWORD_RE.finditer(data):
+            key = match.group(1).lower().decode("ascii")
+            found.add(key)
+            if key == _DECISIVE_KEY:
+                # Nothing can outrank the first keyword of the first category.
+                break
+
+
+def _clone_file(source: Path, target: Path) -> Path:
+    """Copy ``source`` to ``target`` without moving bytes through userspace.
+
+    A reflink is attempted first, then an in-kernel ``copy_file_range``. Any
+    failure (unsupported filesystem, cross-device copy, non-Linux host) falls
+    back to :func:`shutil.copy2`.
+    """
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except (AttributeError, OSError):
+                # Copy until EOF rather than to the size seen at open time:
+                # logs are often still being appended while we copy them.
+                while os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK):
+                    pass
+        shutil.copystat(source, target)
+    except (AttributeError, OSError):
+        shutil.copy2(source, target)
+    return target
+
 
 class ArtifactStore:
     """Persist incident artifacts and manifests for offline review."""
@@ -146,8 +264,13 @@ class ArtifactStore:
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
 
-    def create_incident_dir(self, event_id: str) -> Path:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    def create_incident_dir(self, event_id: str, now: Optional[datetime] = None) -> Path:
+        now = now or datetime.now(timezone.utc)
+        # Equivalent to strftime("%Y%m%dT%H%M%SZ") without the formatter cost.
+        timestamp = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"T{now.hour:02d}{now.minute:02d}{now.second:02d}Z"
+        )
         path = self.root / timestamp / event_id
         path.mkdir(parents=True, exist_ok=True)
         return path
@@ -158,7 +281,8 @@ class ArtifactStore:
         classification: ClassificationResult,
         policy: Dict[str, Any],
     ) -> Path:
-        incident_dir = self.create_incident_dir(event.event_id)
+        now = datetime.now(timezone.utc)
+        incident_dir = self.create_incident_dir(event.event_id, now)
         manifest = {
             "event_id": event.event_id,
             "source": str(event.source_path),
@@ -169,20 +293,29 @@ class ArtifactStore:
                 "signals": classification.signals,
             },
             "policy_decision": policy,
-            "recorded_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "recorded_at": (
+                f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+                f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}.{now.microsecond:06d}Z"
+            ),
         }
-        (incident_dir / "manifest.json").write_text(
-            json.dumps(manifest, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        manifest_path = incident_dir / "manifest.json"
+        if orjson is not None:
+            manifest_path.write_bytes(
+                orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+        else:
+            manifest_path.write_text(
+                json.dumps(manifest, indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
 
         if event.log_path and event.log_path.exists():
             target = incident_dir / event.log_path.name
             if event.log_path.is_file():
-                shutil.copy2(event.log_path, target)
+                _clone_file(event.log_path, target)
             else:
                 # If log path is a directory, copy recursively.
-                shutil.copytree(event.log_path, target, dirs_exist_ok=True)
+                shutil.copytree(event.log_path, target, dirs_exist_ok=True, copy_function=_clone_file)
 
         return incident_dir
 
@@ -205,7 +338,7 @@ class RemediationWorkflowTrigger:
         fixer = mapping.get(classification.category, "refactor")
         return [*self.cli, "auto-fix", fixer]
 
-    def trigger(
+    async def trigger(
         self,
         classification: ClassificationResult,
         incident_dir: Path,
@@ -225,26 +358,44 @@ class RemediationWorkflowTrigger:
         env.setdefault("TRIAGE_CONFIDENCE", f"{classification.confidence:.2f}")
 
         print(f"[TRIAGE] Triggering remediation: {' '.join(command)}")
-        return subprocess.run(
-            command,
-            check=False,
-            capture_output=True,
-            text=True,
+        # Run the fixer without blocking the event loop so other events keep
+        # flowing while a long ``cargo run`` is in progress.
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             env=env,
         )
+        stdout, stderr = await process.communicate()
+        return subprocess.CompletedProcess(
+            command,
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
 
 
 class DirectoryEventSource:
-    """Poll a directory for new triage events."""
+    """Watch a directory for new triage events.
+
+    On Linux with ``asyncinotify`` installed the kernel pushes file
+    notifications, so an idle service does no work. Otherwise, and always in
+    ``run_once`` mode, the directory is polled every ``poll_interval`` seconds.
+    """
 
     def __init__(self, directory: Path, poll_interval: float = 1.0, run_once: bool = False) -> None:
         self.directory = directory
         self.poll_interval = poll_interval
         self.run_once = run_once
         self._seen: set[Path] = set()
+        self._seen_limit = SEEN_PRUNE_THRESHOLD
         self.directory.mkdir(parents=True, exist_ok=True)
 
     async def __aiter__(self) -> Iterable[TriageEvent]:
+        if Inotify is not None and not self.run_once:
+            async for event in self._watch():
+                yield event
+            return
         while True:
             events = self._collect_events()
             if not events and self.run_once and self._seen:
@@ -255,21 +406,49 @@ class DirectoryEventSource:
             if self.run_once and self._seen:
                 break
 
+    async def _watch(self) -> AsyncIterator[TriageEvent]:
+        with Inotify() as inotify:
+            # Register the watch before the initial scan so files landing in
+            # between are reported rather than missed.
+            inotify.add_watch(self.directory, Mask.CLOSE_WRITE | Mask.MOVED_TO)
+            for event in self._collect_events():
+                yield event
+            async for change in inotify:
+                path = change.path
+                if path is None:
+                    continue
+                event = self._load(path)
+                if event is not None:
+                    yield event
+                if len(self._seen) > self._seen_limit:
+                    self._prune_seen(self.directory.iterdir())
+
     def _collect_events(self) -> list[TriageEvent]:
         collected: list[TriageEvent] = []
-        for path in sorted(self.directory.iterdir()):
-            if path in self._seen or path.suffix not in SUPPORTED_EXTENSIONS:
-                continue
-            try:
-                event = TriageEvent.from_file(path)
-            except Exception as exc:  # pragma: no cover - defensive fallback
-                print(f"[TRIAGE] Failed to parse event {path}: {exc}", file=sys.stderr)
-                self._seen.add(path)
-                continue
-            self._seen.add(path)
-            collected.append(event)
+        paths = sorted(self.directory.iterdir())
+        self._prune_seen(paths)
+        for path in paths:
+            event = self._load(path)
+            if event is not None:
+                collected.append(event)
         return collected
 
+    def _prune_seen(self, present: Iterable[Path]) -> None:
+        """Forget event files that are no longer in the directory."""
+        self._seen.intersection_update(present)
+        # Back off when the directory itself is large so pruning stays amortised.
+        self._seen_limit = max(SEEN_PRUNE_THRESHOLD, 2 * len(self._seen))
+
+    def _load(self, path: Path) -> Optional[TriageEvent]:
+        if path in self._seen or path.suffix not in SUPPORTED_EXTENSIONS:
+            return None
+        self._seen.add(path)
+        try:
+            return TriageEvent.from_file(path)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            print(f"[TRIAGE] Failed to parse event {path}: {exc}", file=sys.stderr)
+            return None
+
 
 class TriageService:
     """High-level orchestration for the triage loop."""
@@ -282,13 +461,17 @@ class TriageService:
         trigger: RemediationWorkflowTrigger,
         *,
         dry_run: bool = False,
+        max_concurrency: int = 4,
     ) -> None:
         self.event_source = event_source
         self.classifier = classifier
         self.store = store
         self.trigger = trigger
         self.dry_run = dry_run
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self._stopped = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_concurrency)
 
     async def run(self) -> None:
         loop = asyncio.get_running_loop()
@@ -297,12 +480,39 @@ class TriageService:
             loop.add_signal_handler(signal.SIGINT, self._stopped.set)
             loop.add_signal_handler(signal.SIGTERM, self._stopped.set)
 
+        pending: set[asyncio.Task[None]] = set()
+        failures: list[BaseException] = []
+
+        def finished(task: asyncio.Task[None]) -> None:
+            # Report failures as they happen instead of leaving them to a
+            # "Task exception was never retrieved" warning at GC time.
+            pending.discard(task)
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if exc is not None:
+                failures.append(exc)
+                print(f"[TRIAGE] Event handling failed: {exc!r}", file=sys.stderr)
+
         async for event in self.event_source:
             if self._stopped.is_set():
                 break
-            await self._handle_event(event)
-            if self.event_source.run_once:
+            await self._slots.acquire()
+            task = asyncio.create_task(self._handle_in_slot(event))
+            pending.add(task)
+            task.add_done_callback(finished)
+            if failures or self.event_source.run_once:
                 break
+        if pending:
+            await asyncio.wait(pending)
+        if failures:
+            raise failures[0]
+
+    async def _handle_in_slot(self, event: TriageEvent) -> None:
+        try:
+            await self._handle_event(event)
+        finally:
+            self._slots.release()
 
     async def _handle_event(self, event: TriageEvent) -> None:
         print(f"[TRIAGE] Processing event {event.event_id}")
@@ -314,7 +524,7 @@ class TriageService:
         }
         incident_dir = self.store.store(event, classification, policy)
 
-        result = self.trigger.trigger(classification, incident_dir, event, dry_run=self.dry_run)
+        result = await self.trigger.trigger(classification, incident_dir, event, dry_run=self.dry_run)
         command_display = (
             result.args
             if isinstance(result.args, str)
@@ -341,6 +551,13 @@ class TriageService:
             )
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the NOA ARK OS triage service")
     parser.add_argument(
@@ -388,6 +605,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Record incidents without executing remediation commands.",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=_positive_int,
+        default=4,
+        help="Maximum number of events remediated at the same time.",
+    )
     return parser
 
 
@@ -426,7 +649,14 @@ def main(argv: Optional[list[str]] = None) -> int:
     classifier = FailureClassifier()
     store = ArtifactStore(args.incident_root)
     trigger = RemediationWorkflowTrigger(cli)
-    service = TriageService(source, classifier, store, trigger, dry_run=args.dry_run)
+    service = TriageService(
+        source,
+        classifier,
+        store,
+        trigger,
+        dry_run=args.dry_run,
+        max_concurrency=args.max_concurrency,
+    )
 
     print(
         "[TRIAGE] Starting event-driven triage service\n"
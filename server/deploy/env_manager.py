@@ -5,12 +5,14 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from urllib import request, error
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -18,6 +20,9 @@ COMPOSE_FILE = REPO_ROOT / "server" / "docker-compose.yml"
 HELM_CHART = REPO_ROOT / "server" / "helm"
 EVIDENCE_DIR = REPO_ROOT / "var" / "telemetry" / "deploy"
 EVIDENCE_DIR.mkdir(parents=True, exist_ok=True)
+CONFIG_DIGEST_FILE = EVIDENCE_DIR / "last_config.sha"
+COMPOSE_BASE = ("docker", "compose", "-f", str(COMPOSE_FILE))
+DEFAULT_HEALTH_URL = "http://localhost:8080/health"
 
 
 def _env_with_password(password: Optional[str]) -> Dict[str, str]:
@@ -34,67 +39,113 @@ def _run(command: List[str], env: Optional[Dict[str, str]] = None) -> None:
 
 
 def _capture_compose_logs(tag: str, env: Dict[str, str]) -> Path:
-<<<<<<< Updated upstream
     timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-=======
-<<<<<<< HEAD
-    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-=======
-    timestamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
->>>>>>> 4931f485 (server: add docker-compose stack, Helm chart, env_manager helper; README: document containerized deployment)
->>>>>>> Stashed changes
     destination = EVIDENCE_DIR / f"compose-{timestamp}-{tag}.log"
+    # Stream straight into the evidence file rather than buffering the whole
+    # log in memory first.
+    with destination.open("wb") as handle:
+        subprocess.run([*COMPOSE_BASE, "logs", "--no-color"], check=True, stdout=handle, env=env)
+    print(f"Captured compose logs at {destination}")
+    return destination
+
+
+def _probe_health(url: str, timeout: float) -> bool:
+    try:
+        with request.urlopen(url, timeout=timeout) as response:
+            if 200 <= response.status < 300:
+                print(f"Health check succeeded for {url}")
+                return True
+    except (error.URLError, OSError) as exc:  # pragma: no cover - best-effort network probe
+        print(f"Waiting for health at {url}: {exc}")
+    return False
+
+
+def _wait_for_health(urls: List[str], timeout: int) -> None:
+    """Poll every URL concurrently until all report 2xx or ``timeout`` expires.
+
+    Polling backs off from 0.5s to 2s so fast-starting services are noticed
+    quickly, and one hung endpoint no longer delays probes of the others.
+    """
+    deadline = time.monotonic() + timeout
+    pending = list(dict.fromkeys(urls))
+    delay = 0.5
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            probe_timeout = min(5.0, remaining)
+            healthy = list(executor.map(lambda url: _probe_health(url, probe_timeout), pending))
+            pending = [url for url, ok in zip(pending, healthy) if not ok]
+            if pending:
+                time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+                delay = min(delay * 2, 2.0)
+    if pending:
+        raise TimeoutError(f"Timed out waiting for {', '.join(pending)}")
+
+
+def _compose_config_digest(env: Dict[str, str]) -> Tuple[str, Set[str]]:
+    """Hash the resolved compose config; also return the services it defines."""
     result = subprocess.run(
-        ["docker", "compose", "-f", str(COMPOSE_FILE), "logs", "--no-color"],
+        [*COMPOSE_BASE, "config", "--hash=*"],
         check=True,
         capture_output=True,
-        text=True,
         env=env,
     )
-    destination.write_text(result.stdout)
-    print(f"Captured compose logs at {destination}")
-    return destination
+    # One "<service> <hash>" line per service.
+    services = {line.split()[0] for line in result.stdout.decode().splitlines() if line.strip()}
+    return hashlib.sha256(result.stdout).hexdigest(), services
 
 
-def _wait_for_health(url: str, timeout: int) -> None:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            with request.urlopen(url, timeout=5) as response:
-                if 200 <= response.status < 300:
-                    print(f"Health check succeeded for {url}")
-                    return
-        except error.URLError as exc:  # pragma: no cover - best-effort network probe
-            print(f"Waiting for health at {url}: {exc}")
-        time.sleep(2)
-    raise TimeoutError(f"Timed out waiting for {url}")
+def _running_services(env: Dict[str, str]) -> Set[str]:
+    result = subprocess.run(
+        [*COMPOSE_BASE, "ps", "--status", "running", "--services"],
+        check=True,
+        capture_output=True,
+        env=env,
+    )
+    return {line.strip() for line in result.stdout.decode().splitlines() if line.strip()}
+
+
+def _stack_is_current(env: Dict[str, str], digest: str, services: Set[str]) -> bool:
+    """True when the config matches the last 'up' and every service is running.
+
+    Containers stopped outside this tool (``docker stop``, a host reboot) keep
+    the cached hash valid, so the hash alone cannot justify skipping 'up'.
+    """
+    cached = CONFIG_DIGEST_FILE.read_text().strip() if CONFIG_DIGEST_FILE.exists() else None
+    return digest == cached and services <= _running_services(env)
 
 
 def command_compose_up(args: argparse.Namespace) -> None:
     env = _env_with_password(args.password)
-    _run(["docker", "compose", "-f", str(COMPOSE_FILE), "up", "-d"], env=env)
-    if args.wait:
-        _wait_for_health(args.health_url, args.timeout)
+    digest, services = _compose_config_digest(env) if args.skip_if_unchanged else (None, set())
+    waited = False
+    if digest is not None and _stack_is_current(env, digest, services):
+        print("Compose configuration unchanged and all services running; skipping 'up'")
+    else:
+        command = [*COMPOSE_BASE, "up", "-d"]
+        if args.wait:
+            # Let the engine block on the services' own healthchecks instead of
+            # polling from here after 'up' returns.
+            command += ["--wait", "--wait-timeout", str(args.timeout)]
+            waited = True
+        _run(command, env=env)
+        if digest is not None:
+            CONFIG_DIGEST_FILE.write_text(digest + "\n")
+    if args.wait and (args.health_url or not waited):
+        _wait_for_health(args.health_url or [DEFAULT_HEALTH_URL], args.timeout)
     _capture_compose_logs("up", env)
 
 
 def command_compose_down(args: argparse.Namespace) -> None:
     env = _env_with_password(args.password)
-    cmd = ["docker", "compose", "-f", str(COMPOSE_FILE), "down"]
+    cmd = [*COMPOSE_BASE, "down"]
     if args.prune:
         cmd.append("-v")
-<<<<<<< Updated upstream
-    _capture_compose_logs("down", env)
-    _run(cmd, env=env)
-=======
-<<<<<<< HEAD
     _capture_compose_logs("down", env)
     _run(cmd, env=env)
-=======
-    _run(cmd, env=env)
-    _capture_compose_logs("down", env)
->>>>>>> 4931f485 (server: add docker-compose stack, Helm chart, env_manager helper; README: document containerized deployment)
->>>>>>> Stashed changes
+    CONFIG_DIGEST_FILE.unlink(missing_ok=True)
 
 
 def command_compose_logs(args: argparse.Namespace) -> None:
@@ -103,7 +154,7 @@ def command_compose_logs(args: argparse.Namespace) -> None:
 
 
 def command_compose_health(args: argparse.Namespace) -> None:
-    _wait_for_health(args.health_url, args.timeout)
+    _wait_for_health(args.health_url or [DEFAULT_HEALTH_URL], args.timeout)
 
 
 def command_helm_install(args: argparse.Namespace) -> None:
@@ -161,9 +212,18 @@ def build_parser() -> argparse.ArgumentParser:
 
     compose_up = subparsers.add_parser("compose-up", help="Start docker compose environment")
     compose_up.add_argument("--password", help="Postgres password override")
-    compose_up.add_argument("--wait", action="store_true", help="Wait for HTTP health")
-    compose_up.add_argument("--health-url", default="http://localhost:8080/health")
+    compose_up.add_argument("--wait", action="store_true", help="Wait for service healthchecks")
+    compose_up.add_argument(
+        "--health-url",
+        action="append",
+        help="Health endpoint to poll after 'up'; repeat to wait on several",
+    )
     compose_up.add_argument("--timeout", type=int, default=120)
+    compose_up.add_argument(
+        "--skip-if-unchanged",
+        action="store_true",
+        help="Skip 'up' when the compose config hash matches the last successful run and every service is running",
+    )
     compose_up.set_defaults(func=command_compose_up)
 
     compose_down = subparsers.add_parser("compose-down", help="Stop docker compose environment")
@@ -177,7 +237,11 @@ def build_parser() -> argparse.ArgumentParser:
     compose_logs.set_defaults(func=command_compose_logs)
 
     compose_health = subparsers.add_parser("compose-health", help="Poll health endpoint")
-    compose_health.add_argument("--health-url", default="http://localhost:8080/health")
+    compose_health.add_argument(
+        "--health-url",
+        action="append",
+        help="Health endpoint to poll; repeat to wait on several (default: http://localhost:8080/health)",
+    )
     compose_health.add_argument("--timeout", type=int, default=120)
     compose_health.set_defaults(func=command_compose_health)
 
@@ -1,21 +1,69 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import json
+import os
 import shutil
+import tarfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 from core.kernel.manifest import KernelManifest, KernelService, load_manifest
-from scripts.packaging.kernel_package import build_artifacts, validate_artifacts
+from scripts.packaging.kernel_package import ZSTD_COMPRESS_LEVEL, build_artifacts, validate_artifacts
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # pragma: no cover - optional zstd snapshots
+    import zstandard
+except ImportError:  # pragma: no cover - gztar fallback
+    zstandard = None
 
 DEFAULT_PROFILE_PATH = Path(__file__).with_name("single_host_profile.json")
 STATE_ROOT = Path("var/state/single-host")
 TELEMETRY_ROOT = Path("var/telemetry")
 
 
+def _dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _loads(data: bytes) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Readers such as status() must never observe a half-written file; a
+    # rename within the same directory is atomic on POSIX.
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_profile(path: str, mtime_ns: int) -> Dict[str, object]:
+    data = json.loads(Path(path).read_text())
+    required_keys = {"profile", "manifest", "boot", "health", "observability", "resources"}
+    missing = required_keys.difference(data)
+    if missing:
+        raise ValueError(f"Profile missing keys: {sorted(missing)}")
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _read_manifest(path: str, mtime_ns: int) -> KernelManifest:
+    return load_manifest(Path(path))
+
+
 @dataclass
 class ServiceStatus:
     service: str
@@ -30,28 +78,44 @@ class SingleHostOrchestrator:
         self.profile_path = profile_path or DEFAULT_PROFILE_PATH
         self.profile = self._load_profile(self.profile_path)
         manifest_path = (self.profile_path.parent / self.profile["manifest"]).resolve()
-        self.manifest: KernelManifest = load_manifest(manifest_path)
+        # Parsed profiles and manifests are cached across orchestrators in the
+        # same process; keying on mtime picks up edits made on disk. Each
+        # orchestrator gets its own copy so mutations never reach the cache.
+        self.manifest: KernelManifest = copy.deepcopy(
+            _read_manifest(str(manifest_path), manifest_path.stat().st_mtime_ns)
+        )
+        self._boot_order: Optional[List[KernelService]] = None
         self.state_dir = (root / STATE_ROOT).resolve()
         self.telemetry_dir = (root / TELEMETRY_ROOT).resolve()
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.telemetry_dir.mkdir(parents=True, exist_ok=True)
+        # Per-service paths are fixed for the lifetime of the profile, so render
+        # the templates once instead of on every start/status call.
+        template = self.profile["health"]["readinessFile"]
+        self._readiness_paths: Dict[str, Path] = {
+            service.id: self.state_dir / template.format(service=service.id) for service in self.inventory()
+        }
+        self._metrics_paths: Dict[str, Path] = {
+            service_id: self.telemetry_dir / metrics_path
+            for service_id, metrics_path in self.profile["observability"].get("metrics", {}).items()
+            if metrics_path
+        }
 
     @staticmethod
     def _load_profile(path: Path) -> Dict[str, object]:
-        data = json.loads(path.read_text())
-        required_keys = {"profile", "manifest", "boot", "health", "observability", "resources"}
-        missing = required_keys.difference(data)
-        if missing:
-            raise ValueError(f"Profile missing keys: {sorted(missing)}")
-        return data
+        return copy.deepcopy(_read_profile(str(path.resolve()), path.stat().st_mtime_ns))
 
     def inventory(self) -> List[KernelService]:
-        return self.manifest.services_in_boot_order(self.profile["profile"])
+        if self._boot_order is None:
+            self._boot_order = self.manifest.services_in_boot_order(self.profile["profile"])
+        return list(self._boot_order)
 
     def readiness_file(self, service: KernelService) -> Path:
-        template = self.profile["health"]["readinessFile"]
-        path = template.format(service=service.id)
-        return self.state_dir / path
+        path = self._readiness_paths.get(service.id)
+        if path is None:
+            template = self.profile["health"]["readinessFile"]
+            path = self.state_dir / template.format(service=service.id)
+        return path
 
     def _write_state_file(self, service: KernelService) -> None:
         path = self.readiness_file(service)
@@ -62,13 +126,11 @@ class SingleHostOrchestrator:
             "timestamp": time.time(),
             "dependencies": service.dependencies,
         }
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+        _write_atomic(path, _dumps(payload))
 
     def _generate_metrics(self, service: KernelService) -> None:
-        metrics_map = self.profile["observability"].get("metrics", {})
-        metrics_path = metrics_map.get(service.id)
-        if metrics_path:
-            destination = self.telemetry_dir / metrics_path
+        destination = self._metrics_paths.get(service.id)
+        if destination is not None:
             destination.parent.mkdir(parents=True, exist_ok=True)
             metric_payload = {
                 "service": service.id,
@@ -76,27 +138,42 @@ class SingleHostOrchestrator:
                 "health": "ready",
                 "timestamp": time.time(),
             }
-            destination.write_text(json.dumps(metric_payload, indent=2, sort_keys=True))
+            _write_atomic(destination, _dumps(metric_payload))
 
     def start(self) -> List[ServiceStatus]:
         artifact_dir = self.root / "build/artifacts"
         artifact_dir.mkdir(parents=True, exist_ok=True)
+        # State and metrics files do not depend on the artifacts, so write them
+        # while the artifacts are built and hashed; a validation failure still
+        # fails start() once both sides have finished.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            artifacts = executor.submit(self._build_and_validate, artifact_dir)
+            statuses = self._map_services(self._bring_up)
+            artifacts.result()
+        return statuses
+
+    def _build_and_validate(self, artifact_dir: Path) -> None:
         build_artifacts(artifact_dir, manifest=self.manifest)
         validate_artifacts(artifact_dir, manifest=self.manifest)
 
-        statuses = []
-        for service in self.inventory():
-            self._write_state_file(service)
-            self._generate_metrics(service)
-            statuses.append(
-                ServiceStatus(
-                    service=service.id,
-                    ready=True,
-                    readiness_file=self.readiness_file(service),
-                    last_transition=time.time(),
-                )
-            )
-        return statuses
+    def _map_services(self, func) -> List[ServiceStatus]:
+        # Per-service state lives in separate files, so the work is independent;
+        # map() keeps results in boot order.
+        services = self.inventory()
+        if not services:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(services))) as executor:
+            return list(executor.map(func, services))
+
+    def _bring_up(self, service: KernelService) -> ServiceStatus:
+        self._write_state_file(service)
+        self._generate_metrics(service)
+        return ServiceStatus(
+            service=service.id,
+            ready=True,
+            readiness_file=self.readiness_file(service),
+            last_transition=time.time(),
+        )
 
     def stop(self) -> None:
         if self.state_dir.exists():
@@ -107,39 +184,55 @@ class SingleHostOrchestrator:
             self.telemetry_dir.mkdir(parents=True, exist_ok=True)
 
     def status(self) -> List[ServiceStatus]:
-        statuses: List[ServiceStatus] = []
-        for service in self.inventory():
-            readiness_file = self.readiness_file(service)
-            ready = readiness_file.exists()
-            timestamp = None
-            if ready:
-                data = json.loads(readiness_file.read_text())
-                timestamp = data.get("timestamp")
-            statuses.append(
-                ServiceStatus(
-                    service=service.id,
-                    ready=ready,
-                    readiness_file=readiness_file,
-                    last_transition=timestamp,
-                )
-            )
-        return statuses
+        present = self._present_readiness_files()
+        return self._map_services(functools.partial(self._read_status, present=present))
+
+    def _present_readiness_files(self) -> Set[str]:
+        # One directory listing per readiness parent replaces a stat per service.
+        present: Set[str] = set()
+        for parent in {self.readiness_file(service).parent for service in self.inventory()}:
+            try:
+                with os.scandir(parent) as entries:
+                    present.update(entry.path for entry in entries)
+            except FileNotFoundError:
+                continue
+        return present
+
+    def _read_status(self, service: KernelService, present: Set[str]) -> ServiceStatus:
+        readiness_file = self.readiness_file(service)
+        ready = str(readiness_file) in present
+        timestamp = None
+        if ready:
+            data = _loads(readiness_file.read_bytes())
+            timestamp = data.get("timestamp")
+        return ServiceStatus(
+            service=service.id,
+            ready=ready,
+            readiness_file=readiness_file,
+            last_transition=timestamp,
+        )
 
     def health_check(self) -> Dict[str, bool]:
-        results: Dict[str, bool] = {}
-        for status in self.status():
-            results[status.service] = status.ready
-        return results
+        # Readiness only needs the listing; the payloads are never opened.
+        present = self._present_readiness_files()
+        return {service.id: str(self.readiness_file(service)) in present for service in self.inventory()}
 
     def snapshot(self) -> Path:
         bundle_path = self.profile["observability"]["bundlePath"]
         destination = (self.root / bundle_path).resolve()
         destination.parent.mkdir(parents=True, exist_ok=True)
-        archive_path = shutil.make_archive(str(destination), "gztar", root_dir=self.telemetry_dir)
-        return Path(archive_path)
+        if zstandard is None:
+            archive_path = shutil.make_archive(str(destination), "gztar", root_dir=self.telemetry_dir)
+            return Path(archive_path)
+        archive_path = Path(f"{destination}.tar.zst")
+        compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESS_LEVEL, threads=-1)
+        with archive_path.open("wb") as handle, compressor.stream_writer(handle) as writer:
+            with tarfile.open(fileobj=writer, mode="w|") as archive:
+                archive.add(self.telemetry_dir, arcname=".")
+        return archive_path
 
     def resource_envelopes(self) -> Dict[str, Dict[str, int]]:
-        return self.profile["resources"]
+        return copy.deepcopy(self.profile["resources"])
 
 
 def _print_inventory(services: Iterable[KernelService]) -> None:
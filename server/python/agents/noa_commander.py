@@ -4,18 +4,28 @@ NOA ExecutiveCommanderChiefAgent - Python Implementation
 Top-level business goal orchestration service
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
 import uvicorn
 import asyncio
 import logging
 import json
+import os
+import re
 import time
 from datetime import datetime
 import uuid
-import requests
+from importlib.util import find_spec
+from collections import defaultdict
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,7 +34,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="NOA ExecutiveCommanderChiefAgent",
     description="Top-level business goal orchestration and task management",
-    version="1.0.0"
+    version="1.0.0",
+    # ORJSONResponse asserts orjson is importable, so only default to it then
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
 
 app.add_middleware(
@@ -61,6 +73,34 @@ class TaskAssignment(BaseModel):
 # Global state
 work_plans: Dict[str, WorkPlan] = {}
 active_tasks: Dict[str, Dict[str, Any]] = {}
+# Reverse index from work plan to its task ids, kept in assignment order so
+# per-plan lookups do not scan every active task.
+plan_to_tasks: Dict[str, List[str]] = defaultdict(list)
+# Serialized JSON per work plan, refreshed whenever a plan changes so listing
+# plans does not walk every Pydantic model on each request.
+work_plans_serialized: Dict[str, bytes] = {}
+
+# Shared keep-alive client for the Trifecta Court so concurrent intakes reuse
+# pooled connections instead of blocking the event loop on a fresh handshake.
+# When the court exposes a local Unix socket, talk over it and skip TCP.
+# A custom transport ignores the client's limits, so it carries its own.
+COURT_SOCKET = "/var/run/noa/court.sock"
+_court_limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_court_client = httpx.AsyncClient(
+    base_url="http://localhost:8000",
+    timeout=10.0,
+    limits=_court_limits,
+    transport=(
+        httpx.AsyncHTTPTransport(uds=COURT_SOCKET, limits=_court_limits)
+        if os.path.exists(COURT_SOCKET)
+        else None
+    ),
+)
+
+@app.on_event("shutdown")
+async def close_court_client():
+    """Release pooled Trifecta Court connections"""
+    await _court_client.aclose()
 
 @app.get("/")
 async def root():
@@ -93,8 +133,9 @@ async def health_check():
 async def intake_business_goal(goal: BusinessGoal):
     """Intake and normalize business goals into structured WorkPlans"""
     try:
-        # Generate work plan ID
+        # Generate work plan ID and a single timestamp for this request
         plan_id = str(uuid.uuid4())
+        now = datetime.utcnow().isoformat()
         
         # Decompose goal into tasks
         tasks = await decompose_goal(goal.goal_description, goal.context)
@@ -109,16 +150,18 @@ async def intake_business_goal(goal: BusinessGoal):
             tasks=tasks,
             assigned_resources=resources,
             status="planned",
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat()
+            created_at=now,
+            updated_at=now
         )
         
         work_plans[plan_id] = work_plan
+        plan_dict = work_plan.dict()
+        _cache_work_plan(work_plan, plan_dict)
         
         # Validate with constitutional framework
         constitutional_result = await validate_with_trifecta_court(
             f"Execute work plan: {goal.goal_description}",
-            {"work_plan": work_plan.dict(), "goal": goal.dict()}
+            {"work_plan": plan_dict, "goal": goal.dict()}
         )
         
         if not constitutional_result.get("valid", False):
@@ -132,7 +175,7 @@ async def intake_business_goal(goal: BusinessGoal):
         return {
             "status": "success",
             "work_plan_id": plan_id,
-            "work_plan": work_plan.dict(),
+            "work_plan": plan_dict,
             "constitutional_validation": constitutional_result,
             "message": "Business goal successfully converted to work plan"
         }
@@ -154,8 +197,10 @@ async def execute_work_plan(plan_id: str):
             raise HTTPException(status_code=400, detail=f"Work plan is not in planned status: {work_plan.status}")
         
         # Update status
+        now = datetime.utcnow().isoformat()
         work_plan.status = "executing"
-        work_plan.updated_at = datetime.utcnow().isoformat()
+        work_plan.updated_at = now
+        _cache_work_plan(work_plan)
         
         # Execute tasks
         execution_results = []
@@ -173,8 +218,9 @@ async def execute_work_plan(plan_id: str):
                 "task": task,
                 "assignment": assignment_result,
                 "status": "assigned",
-                "started_at": datetime.utcnow().isoformat()
+                "started_at": now
             }
+            plan_to_tasks[plan_id].append(task_id)
         
         logger.info(f"Work plan {plan_id} execution started with {len(execution_results)} tasks")
         
@@ -193,10 +239,14 @@ async def execute_work_plan(plan_id: str):
 @app.get("/plans")
 async def list_work_plans():
     """List all work plans"""
-    return {
-        "work_plans": [plan.dict() for plan in work_plans.values()],
-        "total": len(work_plans)
-    }
+    body = b"".join((
+        b'{"work_plans":[',
+        b",".join(work_plans_serialized.values()),
+        b'],"total":',
+        str(len(work_plans_serialized)).encode(),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
 
 @app.get("/plans/{plan_id}")
 async def get_work_plan(plan_id: str):
@@ -215,18 +265,15 @@ async def get_work_plan_status(plan_id: str):
     work_plan = work_plans[plan_id]
     
     # Get task statuses
-    plan_tasks = [task for task in active_tasks.values() if task["work_plan_id"] == plan_id]
-    
-    task_statuses = {}
-    for task_id, task_info in active_tasks.items():
-        if task_info["work_plan_id"] == plan_id:
-            task_statuses[task_id] = task_info["status"]
+    task_statuses = {
+        task_id: active_tasks[task_id]["status"] for task_id in plan_to_tasks.get(plan_id, ())
+    }
     
     return {
         "work_plan_id": plan_id,
         "status": work_plan.status,
         "total_tasks": len(work_plan.tasks),
-        "active_tasks": len(plan_tasks),
+        "active_tasks": len(task_statuses),
         "task_statuses": task_statuses,
         "updated_at": work_plan.updated_at
     }
@@ -267,34 +314,58 @@ async def complete_task(task_id: str, result: Dict[str, Any]):
         logger.error(f"Failed to complete task {task_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Error completing task: {str(e)}")
 
+def _cache_work_plan(work_plan: WorkPlan, data: Optional[Dict[str, Any]] = None) -> None:
+    """Refresh the serialized form served by ``list_work_plans``"""
+    if data is None:
+        data = work_plan.dict()
+    if orjson is not None:
+        work_plans_serialized[work_plan.id] = orjson.dumps(data)
+    else:
+        work_plans_serialized[work_plan.id] = json.dumps(data, separators=(",", ":")).encode()
+
+# One case-insensitive pass over the goal yields the set of task categories
+_TASK_PATTERNS = re.compile(
+    r"(?P<analysis>analysis|research)"
+    r"|(?P<implementation>implementation|build)"
+    r"|(?P<testing>testing|validation)",
+    re.IGNORECASE,
+)
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate ``count`` random UUIDs from a single urandom read"""
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+
 async def decompose_goal(goal_description: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Decompose business goal into actionable tasks"""
     
-    # Simple task decomposition logic
+    # Simple task decomposition logic; at most three tasks are created
     tasks = []
+    task_ids = iter(_uuid4_batch(3))
+    hits = {match.lastgroup for match in _TASK_PATTERNS.finditer(goal_description)}
     
     # Analyze goal and create tasks
-    if "analysis" in goal_description.lower() or "research" in goal_description.lower():
+    if "analysis" in hits:
         tasks.append({
-            "id": str(uuid.uuid4()),
+            "id": next(task_ids),
             "type": "analysis",
             "description": f"Analyze requirements for: {goal_description}",
             "priority": "high",
             "estimated_duration": "2 hours"
         })
     
-    if "implementation" in goal_description.lower() or "build" in goal_description.lower():
+    if "implementation" in hits:
         tasks.append({
-            "id": str(uuid.uuid4()),
+            "id": next(task_ids),
             "type": "implementation",
             "description": f"Implement solution for: {goal_description}",
             "priority": "high",
             "estimated_duration": "4 hours"
         })
     
-    if "testing" in goal_description.lower() or "validation" in goal_description.lower():
+    if "testing" in hits:
         tasks.append({
-            "id": str(uuid.uuid4()),
+            "id": next(task_ids),
             "type": "testing",
             "description": f"Test and validate: {goal_description}",
             "priority": "medium",
@@ -304,7 +375,7 @@ async def decompose_goal(goal_description: str, context: Dict[str, Any]) -> List
     # Default task if no specific patterns found
     if not tasks:
         tasks.append({
-            "id": str(uuid.uuid4()),
+            "id": next(task_ids),
             "type": "general",
             "description": f"Execute: {goal_description}",
             "priority": "medium",
@@ -378,23 +449,25 @@ async def check_work_plan_completion(work_plan_id: str):
         return
     
     work_plan = work_plans[work_plan_id]
-    plan_tasks = [task for task in active_tasks.values() if task["work_plan_id"] == work_plan_id]
-    
-    completed_tasks = [task for task in plan_tasks if task["status"] == "completed"]
+    completed_tasks = sum(
+        1
+        for task_id in plan_to_tasks.get(work_plan_id, ())
+        if active_tasks[task_id]["status"] == "completed"
+    )
     
-    if len(completed_tasks) == len(work_plan.tasks):
+    if completed_tasks == len(work_plan.tasks):
         work_plan.status = "completed"
         work_plan.updated_at = datetime.utcnow().isoformat()
+        _cache_work_plan(work_plan)
         logger.info(f"Work plan {work_plan_id} completed")
 
 async def validate_with_trifecta_court(action: str, context: Dict[str, Any]) -> Dict[str, Any]:
     """Validate action with Trifecta Court constitutional framework"""
     
     try:
-        response = requests.post(
-            "http://localhost:8000/court/trifecta",
+        response = await _court_client.post(
+            "/court/trifecta",
             json={"action": action, "context": context},
-            timeout=10
         )
         
         if response.status_code == 200:
@@ -422,11 +495,15 @@ async def constitutional_validation_endpoint():
 
 if __name__ == "__main__":
     print("Starting NOA ExecutiveCommanderChiefAgent...")
+    # uvicorn[standard] ships the libuv event loop and the C HTTP parser; use
+    # them when present and fall back to the pure-Python stack otherwise.
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8001,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11"
     )
 
@@ -2,13 +2,16 @@
 import asyncio
 import json
 import numpy as np
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-import pickle
 import time
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 
+NEED_TYPES = ("task_assistance", "information_retrieval", "problem_solving",
+              "optimization", "automation", "communication")
+
 @dataclass
 class UserNeed:
     """Predicted user need representation"""
@@ -28,6 +31,7 @@ class ProactiveAutonomySystem:
         self.problem_predictor = ProblemPredictor()
         self.opportunity_creator = OpportunityCreator()
         self.autonomous_executor = AutonomousTaskExecutor()
+        self.monitoring_tasks: List[asyncio.Task] = []
         
     async def start_proactive_monitoring(self) -> Dict[str, Any]:
         """Start proactive monitoring and anticipation system"""
@@ -42,13 +46,18 @@ class ProactiveAutonomySystem:
         if not validation_result["approved"]:
             return {"status": "rejected", "reason": validation_result["reason"]}
         
-        # Start proactive monitoring tasks
-        monitoring_tasks = await asyncio.gather(
-            self._monitor_user_needs(),
-            self._monitor_potential_problems(),
-            self._monitor_opportunities(),
-            self._execute_proactive_tasks()
-        )
+        # Start proactive monitoring tasks; each monitor loops forever, so run
+        # them detached and keep references so they are not garbage collected
+        monitoring_tasks = [
+            asyncio.create_task(monitor)
+            for monitor in (
+                self._monitor_user_needs(),
+                self._monitor_potential_problems(),
+                self._monitor_opportunities(),
+                self._execute_proactive_tasks()
+            )
+        ]
+        self.monitoring_tasks = monitoring_tasks
         
         return {
             "status": "proactive_monitoring_started",
@@ -159,27 +168,42 @@ class UserNeedPredictor:
         # Feature extraction
         features = await self._extract_features(user_data)
         
-        # Prediction
-        predictions = self.model.predict_proba(features.reshape(1, -1))
+        # Prediction; forests evaluate float32 internally, so hand them a
+        # contiguous float32 row rather than paying for a float64 copy per call
+        row = np.ascontiguousarray(features, dtype=np.float32).reshape(1, -1)
+        predictions = self.model.predict_proba(row)
         
-        # Convert to UserNeed objects
-        needs = []
-        need_types = ["task_assistance", "information_retrieval", "problem_solving", 
-                     "optimization", "automation", "communication"]
+        # Estimate every likely need concurrently instead of awaiting each
+        # helper in turn
+        probabilities = predictions[0][:len(NEED_TYPES)]
+        likely = np.flatnonzero(probabilities > 0.5)
+        now = time.time()
+        estimates = await asyncio.gather(*(
+            asyncio.gather(
+                self._calculate_urgency(NEED_TYPES[i], user_data),
+                self._estimate_resources(NEED_TYPES[i]),
+                self._estimate_time_to_need(NEED_TYPES[i], user_data)
+            )
+            for i in likely
+        ))
         
-        for i, need_type in enumerate(need_types):
-            if len(predictions[0]) > i and predictions[0][i] > 0.5:
-                need = UserNeed(
-                    need_type=need_type,
-                    confidence=float(predictions[0][i]),
-                    urgency=await self._calculate_urgency(need_type, user_data),
-                    resources_required=await self._estimate_resources(need_type),
-                    predicted_time=time.time() + await self._estimate_time_to_need(need_type, user_data),
-                    constitutional_validation={}
-                )
-                needs.append(need)
+        # Rank by confidence * urgency; a stable argsort on the negated scores
+        # keeps ties in need-type order, matching sorted(..., reverse=True)
+        urgencies = np.fromiter((urgency for urgency, _, _ in estimates), dtype=float, count=len(estimates))
+        order = np.argsort(-(probabilities[likely] * urgencies), kind="stable")
         
-        return sorted(needs, key=lambda x: x.confidence * x.urgency, reverse=True)
+        # Convert to UserNeed objects
+        return [
+            UserNeed(
+                need_type=NEED_TYPES[likely[k]],
+                confidence=float(probabilities[likely[k]]),
+                urgency=estimates[k][0],
+                resources_required=estimates[k][1],
+                predicted_time=now + estimates[k][2],
+                constitutional_validation={}
+            )
+            for k in order
+        ]
 
 class ProblemPredictor:
     """Advanced problem prediction and prevention system"""
@@ -238,22 +262,14 @@ class OpportunityCreator:
     async def identify_opportunities(self, environment: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify optimization and improvement opportunities"""
         
-        opportunities = []
-        
-        # Performance optimization opportunities
-        perf_opportunities = await self._identify_performance_opportunities(environment)
-        opportunities.extend(perf_opportunities)
-        
-        # Resource optimization opportunities
-        resource_opportunities = await self._identify_resource_opportunities(environment)
-        opportunities.extend(resource_opportunities)
-        
-        # Automation opportunities
-        automation_opportunities = await self._identify_automation_opportunities(environment)
-        opportunities.extend(automation_opportunities)
-        
-        # Learning opportunities
-        learning_opportunities = await self._identify_learning_opportunities(environment)
-        opportunities.extend(learning_opportunities)
+        # Performance, resource, automation and learning opportunities are
+        # independent, so look for them concurrently
+        performance, resources, automation, learning = await asyncio.gather(
+            self._identify_performance_opportunities(environment),
+            self._identify_resource_opportunities(environment),
+            self._identify_automation_opportunities(environment),
+            self._identify_learning_opportunities(environment)
+        )
+        opportunities = [*performance, *resources, *automation, *learning]
         
-        return sorted(opportunities, key=lambda x: x["value_score"], reverse=True)
+        return sorted(opportunities, key=itemgetter("value_score"), reverse=True)
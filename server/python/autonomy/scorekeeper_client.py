@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import copy
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, Tuple
 
 from .self_status import SelfStatusAggregator
 
@@ -34,16 +35,19 @@ class ScorekeeperClient:
     ) -> None:
         self.aggregator = aggregator or SelfStatusAggregator()
         self.capability_threshold = capability_threshold
+        # Signals for the most recent status snapshot, keyed by its timestamp.
+        self._cached: Optional[Tuple[str, TrustSignals]] = None
 
     def evaluate(self) -> TrustSignals:
         status = self.aggregator.collect()
+        if self._cached is not None and self._cached[0] == status.generated_at:
+            return self._copy(self._cached[1])
         goal_metrics = status.telemetry.get("goal_metrics", {})
         avg_success = float(goal_metrics.get("avg_success_rate", 0.0))
         drift_count = len(status.drift)
-        offender_penalty = sum(
-            0.1 if offender.severity == "medium" else 0.2
-            for offender in status.budget_offenders
-        )
+        offenders = status.budget_offenders
+        medium = sum(1 for offender in offenders if offender.severity == "medium")
+        offender_penalty = 0.1 * medium + 0.2 * (len(offenders) - medium)
         capability = _clamp(avg_success)
         integrity = _clamp(1.0 - min(1.0, drift_count * 0.1))
         reversibility = _clamp(1.0 - offender_penalty)
@@ -55,18 +59,26 @@ class ScorekeeperClient:
                     "severity": offender.severity,
                     "rationale": offender.rationale,
                 }
-                for offender in status.budget_offenders
+                for offender in offenders
             ],
             "goal_metrics": goal_metrics,
             "generated_at": status.generated_at,
         }
-        return TrustSignals(
+        signals = TrustSignals(
             capability=capability,
             integrity=integrity,
             reversibility=reversibility,
             capability_threshold=self.capability_threshold,
             metadata=metadata,
         )
+        self._cached = (status.generated_at, signals)
+        return self._copy(signals)
+
+    @staticmethod
+    def _copy(signals: TrustSignals) -> TrustSignals:
+        # Callers may annotate the signals they receive; hand out copies so the
+        # cached snapshot stays intact for the next evaluation.
+        return replace(signals, metadata=copy.deepcopy(signals.metadata))
 
 
 __all__ = ["ScorekeeperClient", "TrustSignals"]
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from server.python.autonomy.scorekeeper_client import ScorekeeperClient
-from server.python.autonomy.self_status import SelfStatus
+from server.python.autonomy.self_status import BudgetOffender, SelfStatus
 
 
 class StubAggregator:
@@ -38,3 +38,36 @@ def test_scorekeeper_logs_trust_snapshot(tmp_path: Path) -> None:
     assert pytest.approx(payload["capability"]) == signals.capability
     assert payload["metadata"]["budget_guardian"]["sample_count"] == 5
     assert payload["metadata"]["goal_metrics"]["avg_success_rate"] == 0.85
+
+
+class OffenderAggregator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def collect(self) -> SelfStatus:
+        self.calls += 1
+        offenders = [
+            BudgetOffender("goal-a", "wf-a", 900.0, "medium", "slow"),
+            BudgetOffender("goal-b", "wf-b", 2400.0, "high", "very slow"),
+        ]
+        return SelfStatus(
+            drift=[],
+            hot_paths=[],
+            budget_offenders=offenders,
+            telemetry={"goal_metrics": {"avg_success_rate": 0.9}},
+            generated_at="2024-03-15T12:00:00Z",
+        )
+
+
+def test_scorekeeper_reuses_signals_for_same_snapshot() -> None:
+    aggregator = OffenderAggregator()
+    client = ScorekeeperClient(aggregator=aggregator)
+    first = client.evaluate()
+    second = client.evaluate()
+
+    assert aggregator.calls == 2
+    assert second == first
+    assert second is not first
+    second.metadata["budget_offenders"].clear()
+    assert pytest.approx(first.reversibility) == 0.7
+    assert [o["goal_id"] for o in first.metadata["budget_offenders"]] == ["goal-a", "goal-b"]
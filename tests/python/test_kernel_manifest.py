@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import tarfile
+from dataclasses import replace
 from pathlib import Path
 
 from core.kernel.manifest import load_manifest
 from scripts.ci.check_kernel_manifest import check_manifest
-from scripts.packaging.kernel_package import build_artifacts, validate_artifacts
+from scripts.packaging.kernel_package import _build_one, build_artifacts, validate_artifacts
 from scripts.packaging.validate_compatibility import validate
 
 
@@ -23,3 +25,16 @@ def test_manifest_loads_and_artifacts_build(tmp_path: Path) -> None:
 
     validate(manifest)
     check_manifest(Path("."), manifest)
+
+
+def test_fractional_resources_are_packaged(tmp_path: Path) -> None:
+    manifest = load_manifest()
+    service = next(iter(manifest.services.values()))
+    service = replace(service, resources={**service.resources, "cpu": 0.5})
+
+    result = _build_one(service, tmp_path)
+
+    tarball = next(path for path in result.artifacts if path.name.endswith(".tar.gz"))
+    with tarfile.open(tarball) as archive:
+        layout = json.loads(archive.extractfile("manifest.json").read())
+    assert layout["resources"]["cpu"] == 0.5
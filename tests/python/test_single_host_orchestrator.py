@@ -25,3 +25,14 @@ def test_single_host_lifecycle(tmp_path: Path) -> None:
     orchestrator.stop()
     statuses_after_stop = orchestrator.status()
     assert all(not status.ready for status in statuses_after_stop)
+
+
+def test_orchestrators_do_not_share_cached_profile(tmp_path: Path) -> None:
+    first = SingleHostOrchestrator(tmp_path / "a")
+    first.resource_envelopes()["baseline"]["cpuCores"] = 0
+    first.profile["resources"]["baseline"]["cpuCores"] = 0
+    first.manifest.services.clear()
+
+    second = SingleHostOrchestrator(tmp_path / "b")
+    assert second.resource_envelopes()["baseline"]["cpuCores"] >= 8
+    assert second.inventory()[0].id == "kernel"
@@ -72,3 +72,49 @@ def test_triage_archive_loader(tmp_path):
         expected = snapshot["content"].encode(snapshot.get("encoding", "utf-8"))
 
     assert restored == expected, "Restored payload does not match archived content"
+
+
+def test_known_hint_skips_log_scan(tmp_path):
+    from scripts.triage_analyzer import FailureClassifier, TriageEvent
+
+    log_path = tmp_path / "run.log"
+    log_path.write_text("pytest assertion failed\n", encoding="utf-8")
+    event = TriageEvent(
+        event_id="hinted",
+        source_path=tmp_path / "hinted.json",
+        payload={"category": "Lint", "log": str(log_path)},
+    )
+
+    result = FailureClassifier().classify(event)
+    assert result.category == "lint"
+    assert result.confidence == 0.9
+    assert result.signals == ["hint:lint"]
+
+
+def test_event_handler_failure_stops_service(tmp_path, capsys):
+    import asyncio
+
+    import pytest
+
+    from scripts.triage_analyzer import TriageEvent, TriageService
+
+    class EventStream:
+        run_once = False
+
+        async def __aiter__(self):
+            for index in range(50):
+                yield TriageEvent(event_id=f"event-{index}", source_path=tmp_path / f"{index}.json", payload={})
+                await asyncio.sleep(0)
+
+    handled = []
+
+    class FailingService(TriageService):
+        async def _handle_event(self, event):
+            handled.append(event.event_id)
+            raise RuntimeError(f"failed {event.event_id}")
+
+    service = FailingService(EventStream(), None, None, None, max_concurrency=1)
+    with pytest.raises(RuntimeError, match="failed event-0"):
+        asyncio.run(service.run())
+    assert len(handled) < 50
+    assert "Event handling failed" in capsys.readouterr().err